@@ -6,10 +6,10 @@ all the other modules to provide the complete audiobook processing functionality
 """
 
 import sys
+import math
 import configparser
 import logging as log
 import threading
-import time
 from datetime import datetime
 from pathlib import Path
 from typing import List, Tuple, Optional
@@ -153,12 +153,13 @@ class BadaBoomBooksApp:
             True if LLM is available, False otherwise.
         """
         try:
-            from .utils.genre_normalizer import GenreNormalizer
+            from .utils.genre_normalizer import get_normalizer
 
-            log.info("Testing LLM connection for genre categorization...")
-            test_normalizer = GenreNormalizer(use_llm=True)
-
-            return test_normalizer.llm_available
+            # Check the shared instance so genre normalization reuses the result.
+            # Only configuration is checked here; the connection is verified by
+            # the first categorization request.
+            log.info("Checking LLM configuration for genre categorization...")
+            return get_normalizer(use_llm=True).llm_available
 
         except Exception as e:
             log.error(f"Failed to initialize LLM for genre categorization: {e}")
@@ -237,19 +238,19 @@ class BadaBoomBooksApp:
 
             # Phase 1: Identification - Create tasks for all folders (fast, no URL discovery yet)
             try:
-                for i, folder in enumerate(folders):
-                    print(f"\r[{i+1}/{len(folders)}] Identifying books for processing...    ", end='', flush=True)
-
-                    try:
-                        # Create task without URL (URL will be discovered later)
-                        # URL is set to None initially, workers will discover it
-                        self.queue_manager.create_task(job_id, folder, url=None)
-                        log.debug(f"Identified {folder.name} for processing")
+                try:
+                    # Create tasks without URL (URL will be discovered later)
+                    # in one batch insert; workers will discover the URLs
+                    self.queue_manager.create_tasks(job_id, [(folder, None) for folder in folders])
+                    log.debug(f"Identified {len(folders)} folders for processing")
 
-                    except Exception as e:
-                        log.error(f"Error identifying {folder}: {e}")
+                except Exception as e:
+                    # The batch insert is all-or-nothing - discard the empty job
+                    log.error(f"Error identifying folders: {e}")
+                    self.queue_manager.delete_job(job_id)
+                    raise
 
-                print()  # Newline after progress
+                print(f"[{len(folders)}/{len(folders)}] Books identified for processing")
 
             except KeyboardInterrupt:
                 # Identification interrupted - discard incomplete job
@@ -470,7 +471,7 @@ class BadaBoomBooksApp:
                 search_alternatives = generate_search_alternatives(book_info['sources'])
                 # Use best alternative as primary search term for display
                 if search_alternatives:
-                    search_term = search_alternatives[0]['term']
+                    search_term = search_alternatives[0].term
                     log.info(f"[METADATA DEBUG] Using search alternative: {search_term}")
                     print(f"[DEBUG] Search term from alternatives: {search_term}")
                 else:
@@ -1201,7 +1202,8 @@ class BadaBoomBooksApp:
                 exited_with_waiting_tasks = True
                 break
 
-            time.sleep(0.3)
+            # Wake early when an in-process worker changes a task status
+            self.queue_manager.wait_for_task_update(0.3)
 
         # Update job status
         # If exited with waiting_for_user tasks in daemon mode, keep job as 'processing' for resume
@@ -1313,7 +1315,7 @@ class BadaBoomBooksApp:
                     final_score = option.get('final_score')
                     if llm_score is not None:
                         score_str = f" {llm_score:.2f}"
-                        if final_score and abs(llm_score - final_score) > 0.001:
+                        if final_score and not math.isclose(llm_score, final_score, rel_tol=0.0, abs_tol=0.001):
                             score_str += f" (weighted: {final_score:.2f})"
 
                     site_key = option.get('site_key', 'unknown')
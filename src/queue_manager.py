@@ -8,11 +8,13 @@ import os
 import uuid
 import json
 import sqlite3
+import threading
 import logging as log
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Optional, Callable
+from typing import List, Dict, Optional, Callable, Iterable, Tuple
 from dataclasses import asdict
+from contextlib import contextmanager
 
 from huey import SqliteHuey
 
@@ -49,10 +51,18 @@ huey = SqliteHuey(
 class QueueManager:
     """Manages job and task queue for audiobook processing."""
 
+    # Set when a task status changes in this process (worker threads each own
+    # a manager), so job monitors wake without waiting out their poll interval
+    _task_status_changed = threading.Event()
+
     def __init__(self, db_path: Optional[Path] = None):
         """Initialize queue manager with database connection."""
         self.db_path = db_path or _get_database_path()
         self.connection = None
+        self._transaction_depth = 0
+        # The connection is shared across threads (check_same_thread=False),
+        # so writes and transaction() blocks are serialized on this lock
+        self._lock = threading.RLock()
         self._initialize_database()
 
     def _initialize_database(self):
@@ -64,6 +74,17 @@ class QueueManager:
         # This allows workers in different processes to see each other's updates immediately
         cursor = self.connection.cursor()
         cursor.execute('PRAGMA read_uncommitted = 1')
+
+        # WAL lets readers run alongside the writer and, with synchronous=NORMAL,
+        # commits skip the rollback-journal fsync pair. (Huey already puts the
+        # production database in WAL mode; this covers other database paths.)
+        try:
+            cursor.execute('PRAGMA journal_mode = WAL')
+        except sqlite3.OperationalError as e:
+            log.warning(f"Could not enable WAL mode for {self.db_path}: {e}")
+        cursor.execute('PRAGMA synchronous = NORMAL')
+        cursor.execute('PRAGMA temp_store = MEMORY')
+        cursor.execute('PRAGMA cache_size = -8000')  # 8 MB page cache
         cursor.execute('PRAGMA wal_checkpoint(PASSIVE)')  # Ensure WAL is checkpointed
 
         # Jobs table: One per processing request (CLI run or web job)
@@ -206,6 +227,53 @@ class QueueManager:
             log.error(f"Failed to flush Huey queue: {e}", exc_info=True)
             return False
 
+    @contextmanager
+    def transaction(self):
+        """
+        Group several writes into a single commit.
+
+        Inside the block, methods such as create_task() and update_task_status()
+        skip their own commits; everything is committed once on exit, or rolled
+        back if the block raises. The calling thread holds the connection lock
+        for the whole block, so writes from other threads sharing this instance
+        wait until it ends instead of joining (or being rolled back with) it.
+
+        Blocks may be nested. Inner blocks use SAVEPOINTs: an exception raised
+        inside an inner block undoes only that block's writes, even if the outer
+        block catches it. Only the outermost block commits.
+
+        Example:
+            with queue_manager.transaction():
+                queue_manager.create_task(job_id, folder1, url1)
+                queue_manager.create_task(job_id, folder2, url2)
+        """
+        with self._lock:
+            self._transaction_depth += 1
+            savepoint = f"sp_{self._transaction_depth}"
+            try:
+                if self._transaction_depth == 1:
+                    if not self.connection.in_transaction:
+                        self.connection.execute("BEGIN")
+                else:
+                    self.connection.execute(f"SAVEPOINT {savepoint}")
+
+                try:
+                    yield self
+                except BaseException:
+                    if self._transaction_depth == 1:
+                        self.connection.rollback()
+                    else:
+                        self.connection.execute(f"ROLLBACK TO {savepoint}")
+                        self.connection.execute(f"RELEASE {savepoint}")
+                    raise
+
+                if self._transaction_depth == 1:
+                    self.connection.commit()
+                else:
+                    self.connection.execute(f"RELEASE {savepoint}")
+            finally:
+                self._transaction_depth -= 1
+
     def create_job(self, args: ProcessingArgs, user_id: Optional[str] = None) -> str:
         """
         Create a new processing job.
@@ -220,12 +288,12 @@ class QueueManager:
         job_id = str(uuid.uuid4())
         args_json = json.dumps(asdict(args), default=str)
 
-        cursor = self.connection.cursor()
-        cursor.execute("""
-            INSERT INTO jobs (id, status, user_id, args_json)
-            VALUES (?, 'pending', ?, ?)
-        """, (job_id, user_id, args_json))
-        self.connection.commit()
+        with self.transaction():
+            cursor = self.connection.cursor()
+            cursor.execute("""
+                INSERT INTO jobs (id, status, user_id, args_json)
+                VALUES (?, 'pending', ?, ?)
+            """, (job_id, user_id, args_json))
 
         log.info(f"Created job {job_id}")
         return job_id
@@ -242,17 +310,33 @@ class QueueManager:
         Returns:
             task_id: UUID of created task
         """
-        task_id = str(uuid.uuid4())
+        return self.create_tasks(job_id, [(folder_path, url)])[0]
 
-        cursor = self.connection.cursor()
-        cursor.execute("""
-            INSERT INTO tasks (id, job_id, folder_path, url, status)
-            VALUES (?, ?, ?, ?, 'pending')
-        """, (task_id, job_id, str(folder_path), url))
-        self.connection.commit()
+    def create_tasks(self, job_id: str, folders: Iterable[Tuple[Path, Optional[str]]]) -> List[str]:
+        """
+        Create tasks for many audiobooks with one prepared INSERT and one commit.
+
+        Args:
+            job_id: Parent job ID
+            folders: (folder_path, url) pairs; url may be None or the 'OPF' marker
+
+        Returns:
+            task_ids: UUIDs of the created tasks, in input order
+        """
+        rows = [
+            (str(uuid.uuid4()), job_id, str(folder_path), url)
+            for folder_path, url in folders
+        ]
+
+        with self.transaction():
+            cursor = self.connection.cursor()
+            cursor.executemany("""
+                INSERT INTO tasks (id, job_id, folder_path, url, status)
+                VALUES (?, ?, ?, ?, 'pending')
+            """, rows)
 
-        log.debug(f"Created task {task_id} for {folder_path.name}")
-        return task_id
+        log.debug(f"Created {len(rows)} task(s) for job {job_id}")
+        return [row[0] for row in rows]
 
     def get_job(self, job_id: str) -> Optional[Dict]:
         """Retrieve job by ID."""
@@ -279,11 +363,11 @@ class QueueManager:
 
         values.append(job_id)
 
-        cursor = self.connection.cursor()
-        cursor.execute(f"""
-            UPDATE jobs SET {', '.join(set_clauses)} WHERE id = ?
-        """, values)
-        self.connection.commit()
+        with self.transaction():
+            cursor = self.connection.cursor()
+            cursor.execute(f"""
+                UPDATE jobs SET {', '.join(set_clauses)} WHERE id = ?
+            """, values)
 
     def delete_job(self, job_id: str):
         """
@@ -292,16 +376,16 @@ class QueueManager:
         Args:
             job_id: Job ID to delete
         """
-        cursor = self.connection.cursor()
+        with self.transaction():
+            cursor = self.connection.cursor()
 
-        # Delete tasks first (due to foreign key)
-        cursor.execute("DELETE FROM tasks WHERE job_id = ?", (job_id,))
-        tasks_deleted = cursor.rowcount
+            # Delete tasks first (due to foreign key)
+            cursor.execute("DELETE FROM tasks WHERE job_id = ?", (job_id,))
+            tasks_deleted = cursor.rowcount
 
-        # Delete job
-        cursor.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
+            # Delete job
+            cursor.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
 
-        self.connection.commit()
         log.info(f"Deleted job {job_id[:8]} and {tasks_deleted} associated task(s)")
 
     def update_task_status(self, task_id: str, status: str, **kwargs):
@@ -315,11 +399,30 @@ class QueueManager:
 
         values.append(task_id)
 
-        cursor = self.connection.cursor()
-        cursor.execute(f"""
-            UPDATE tasks SET {', '.join(set_clauses)} WHERE id = ?
-        """, values)
-        self.connection.commit()
+        with self.transaction():
+            cursor = self.connection.cursor()
+            cursor.execute(f"""
+                UPDATE tasks SET {', '.join(set_clauses)} WHERE id = ?
+            """, values)
+        QueueManager._task_status_changed.set()
+
+    @classmethod
+    def wait_for_task_update(cls, timeout: float) -> bool:
+        """
+        Wait until a task status changes in this process or the timeout expires.
+
+        Updates made by other processes are not signalled, so callers should
+        keep polling the database with a bounded timeout.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if woken by a task status change, False on timeout
+        """
+        changed = cls._task_status_changed.wait(timeout)
+        cls._task_status_changed.clear()
+        return changed
 
     def get_job_progress(self, job_id: str) -> Dict:
         """Get progress statistics for a job."""
@@ -452,11 +555,11 @@ class QueueManager:
             )
 
             # Mark as enqueued to prevent duplicates
-            cursor = self.connection.cursor()
-            cursor.execute("""
-                UPDATE tasks SET enqueued_at = ? WHERE id = ?
-            """, (datetime.now().isoformat(), task_id))
-            self.connection.commit()
+            with self.transaction():
+                cursor = self.connection.cursor()
+                cursor.execute("""
+                    UPDATE tasks SET enqueued_at = ? WHERE id = ?
+                """, (datetime.now().isoformat(), task_id))
 
             log.info(f"Enqueued task {task_id[:8]}... ({Path(folder_path).name}) to Huey")
             return True
@@ -504,10 +607,10 @@ class QueueManager:
                 )
 
                 # Mark as enqueued to prevent duplicates
-                cursor.execute("""
-                    UPDATE tasks SET enqueued_at = ? WHERE id = ?
-                """, (datetime.now().isoformat(), task_id))
-                self.connection.commit()
+                with self.transaction():
+                    cursor.execute("""
+                        UPDATE tasks SET enqueued_at = ? WHERE id = ?
+                    """, (datetime.now().isoformat(), task_id))
 
                 log.debug(f"Enqueued task {task_id[:8]}... ({Path(folder_path).name}) to Huey, result: {result}")
                 enqueued_count += 1
@@ -607,23 +710,23 @@ class QueueManager:
             options: Optional list of available options/candidates
             context: Optional context data (book info, candidates, etc.)
         """
-        cursor = self.connection.cursor()
-        cursor.execute("""
-            UPDATE tasks
-            SET status = 'waiting_for_user',
-                user_input_type = ?,
-                user_input_prompt = ?,
-                user_input_options = ?,
-                user_input_context = ?
-            WHERE id = ?
-        """, (
-            input_type,
-            prompt,
-            json.dumps(options) if options else None,
-            json.dumps(context, default=str) if context else None,
-            task_id
-        ))
-        self.connection.commit()
+        with self.transaction():
+            cursor = self.connection.cursor()
+            cursor.execute("""
+                UPDATE tasks
+                SET status = 'waiting_for_user',
+                    user_input_type = ?,
+                    user_input_prompt = ?,
+                    user_input_options = ?,
+                    user_input_context = ?
+                WHERE id = ?
+            """, (
+                input_type,
+                prompt,
+                json.dumps(options) if options else None,
+                json.dumps(context, default=str) if context else None,
+                task_id
+            ))
         log.debug(f"Task {task_id[:8]} waiting for user input: {input_type}")
 
     def get_tasks_waiting_for_user(self, job_id: Optional[str] = None) -> List[Dict]:
@@ -684,35 +787,35 @@ class QueueManager:
             user_response: User's response (selection, URL, confirmation, etc.)
             clear_input_fields: Whether to clear user_input_* fields (default: True)
         """
-        cursor = self.connection.cursor()
+        with self.transaction():
+            cursor = self.connection.cursor()
 
-        if clear_input_fields:
-            cursor.execute("""
-                UPDATE tasks
-                SET status = 'pending',
-                    user_input_type = NULL,
-                    user_input_prompt = NULL,
-                    user_input_options = NULL,
-                    user_input_context = NULL,
-                    url = CASE
-                        WHEN ? != '' THEN ?
-                        ELSE url
-                    END
-                WHERE id = ?
-            """, (user_response, user_response, task_id))
-        else:
-            # Keep input fields for debugging/auditing
-            cursor.execute("""
-                UPDATE tasks
-                SET status = 'pending',
-                    url = CASE
-                        WHEN ? != '' THEN ?
-                        ELSE url
-                    END
-                WHERE id = ?
-            """, (user_response, user_response, task_id))
+            if clear_input_fields:
+                cursor.execute("""
+                    UPDATE tasks
+                    SET status = 'pending',
+                        user_input_type = NULL,
+                        user_input_prompt = NULL,
+                        user_input_options = NULL,
+                        user_input_context = NULL,
+                        url = CASE
+                            WHEN ? != '' THEN ?
+                            ELSE url
+                        END
+                    WHERE id = ?
+                """, (user_response, user_response, task_id))
+            else:
+                # Keep input fields for debugging/auditing
+                cursor.execute("""
+                    UPDATE tasks
+                    SET status = 'pending',
+                        url = CASE
+                            WHEN ? != '' THEN ?
+                            ELSE url
+                        END
+                    WHERE id = ?
+                """, (user_response, user_response, task_id))
 
-        self.connection.commit()
         log.debug(f"Task {task_id[:8]} resumed with user input")
 
     def close(self):
@@ -916,8 +1019,8 @@ def _discover_url_for_folder(folder_path: Path, args: ProcessingArgs,
                     search_alternatives = generate_search_alternatives(book_info['sources'])
                     # Use best alternative as primary search term for display
                     if search_alternatives:
-                        search_term = search_alternatives[0]['term']
-                        log.info(f"[WORKER] Using search term: {search_term} (from {search_alternatives[0]['source']})")
+                        search_term = search_alternatives[0].term
+                        log.info(f"[WORKER] Using search term: {search_term} (from {search_alternatives[0].source})")
                     else:
                         search_term = generate_search_term(folder_path)
                         search_alternatives = None
@@ -6,6 +6,7 @@ using Selenium WebDriver and DuckDuckGo.
 """
 
 import re
+import math
 import time
 import requests
 import logging as log
@@ -26,7 +27,9 @@ from ..config import (
     YOLO_AUTO_ACCEPT_THRESHOLD
 )
 from ..models import SearchCandidate
+from ..ui.output import OutputFormatter
 from ..utils import wait_with_backoff
+from ..utils.metadata_cleaning import SearchAlternative
 
 
 class AutoSearchEngine:
@@ -82,7 +85,7 @@ class AutoSearchEngine:
     def search_and_select_with_context(self, search_term: str, site_keys: List[str],
                                       book_info: dict = None, search_limit: int = 5,
                                       download_limit: int = 3, delay: float = 2.0,
-                                      search_alternatives: List[dict] = None) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+                                      search_alternatives: List[SearchAlternative] = None) -> Tuple[Optional[str], Optional[str], Optional[str]]:
         """
         Search for candidates across multiple sites and let user select with book context.
 
@@ -94,8 +97,8 @@ class AutoSearchEngine:
             download_limit: Maximum pages per site to download
             delay: Delay between requests
             search_alternatives: Optional list of alternative search terms from different sources
-                                (ID3 tags vs folder name). Each dict contains:
-                                {'source': 'id3'|'folder', 'term': 'search term', 'priority': int, 'details': str}
+                                (ID3 tags vs folder name), as SearchAlternative records with
+                                source ('id3'|'folder'), term, priority and details
 
         Returns:
             Tuple of (site_key, url, html) or (None, None, None) if skipped
@@ -146,9 +149,9 @@ class AutoSearchEngine:
                 # Use all alternatives for comprehensive search
                 for alt in search_alternatives:
                     search_terms_to_try.append({
-                        'term': alt['term'],
-                        'source': alt['source'],
-                        'details': alt.get('details', '')
+                        'term': alt.term,
+                        'source': alt.source,
+                        'details': alt.details
                     })
                 log.info(f"Using {len(search_terms_to_try)} search alternatives from multiple sources")
             else:
@@ -474,7 +477,7 @@ class AutoSearchEngine:
             score_str = ""
             if llm_score is not None:
                 score_str = f" {llm_score:.2f}"
-                if final_score and abs(llm_score - final_score) > 0.001:
+                if final_score and not math.isclose(llm_score, final_score, rel_tol=0.0, abs_tol=0.001):
                     # Weight was applied
                     score_str += f" (weighted: {final_score:.2f})"
 
@@ -647,41 +650,7 @@ class AutoSearchEngine:
     
     def _display_book_context(self, search_term: str, book_info: dict = None):
         """Display context about the book being processed."""
-        from ..utils import safe_encode_text
-        print("\n" + "="*80)
-        print(safe_encode_text("📚 SELECTING METADATA FOR:"))
-        print("="*80)
-
-        if book_info:
-            # Display available metadata
-            if book_info.get('title'):
-                print(safe_encode_text(f"📖 Title: {book_info['title']}"))
-            if book_info.get('author'):
-                print(safe_encode_text(f"✍️  Author: {book_info['author']}"))
-            if book_info.get('series'):
-                series_info = book_info['series']
-                if book_info.get('volume'):
-                    series_info += f" (Volume {book_info['volume']})"
-                print(safe_encode_text(f"📚 Series: {series_info}"))
-            if book_info.get('narrator'):
-                print(safe_encode_text(f"🎤 Narrator: {book_info['narrator']}"))
-            if book_info.get('publisher'):
-                print(safe_encode_text(f"🏢 Publisher: {book_info['publisher']}"))
-            if book_info.get('year'):
-                print(safe_encode_text(f"📅 Year: {book_info['year']}"))
-            if book_info.get('language'):
-                print(safe_encode_text(f"🌍 Language: {book_info['language']}"))
-            if book_info.get('source'):
-                print(safe_encode_text(f"📂 Source: {book_info['source']}"))
-            
-            # Show folder name if different from title
-            if book_info.get('folder_name') and book_info.get('folder_name') != book_info.get('title'):
-                print(safe_encode_text(f"📁 Folder: {book_info['folder_name']}"))
-        else:
-            # Fallback to search term and folder name
-            print(safe_encode_text(f"🔍 Search term: {search_term}"))
-
-        print("="*80)
+        print(OutputFormatter.format_book_context("📚 SELECTING METADATA FOR:", search_term, book_info))
 
     def _mark_task_waiting_for_user(
         self,
@@ -6,6 +6,7 @@ candidate from multiple search results.
 """
 
 import logging as log
+from operator import itemgetter
 from typing import List, Optional
 
 from ..models import SearchCandidate
@@ -17,6 +18,16 @@ from ..config import (
     WEIGHT_BOOST_FACTOR
 )
 
+# Scraper weight per site key, flattened once from the registry (default 1.0)
+_SCRAPER_WEIGHTS = {
+    site_key: config.get('weight', 1.0) for site_key, config in SCRAPER_REGISTRY.items()
+}
+
+# Score multiplier per site key: final_score = llm_score * (1.0 + (weight - 1.0) * factor)
+_SCRAPER_BOOSTS = {
+    site_key: 1.0 + (weight - 1.0) * WEIGHT_BOOST_FACTOR for site_key, weight in _SCRAPER_WEIGHTS.items()
+}
+
 
 class CandidateSelector:
     """Handles candidate selection logic."""
@@ -99,7 +110,7 @@ class CandidateSelector:
         scored_with_weights = self._apply_scraper_weights(scored_candidates)
 
         # Sort by weighted score (highest first)
-        scored_with_weights.sort(key=lambda x: x[2], reverse=True)
+        scored_with_weights.sort(key=itemgetter(2), reverse=True)
 
         # Store scores for later display
         self.last_scored_candidates = scored_with_weights
@@ -139,21 +150,19 @@ class CandidateSelector:
 
         # Don't apply weights if best score is below minimum threshold
         # This prevents selecting a candidate when all scores are 0.0 or very low
-        should_apply_weights = best_llm_score >= WEIGHT_MIN_SCORE_THRESHOLD
+        if best_llm_score < WEIGHT_MIN_SCORE_THRESHOLD:
+            return [(candidate, llm_score, llm_score) for candidate, llm_score in scored_candidates]
 
         weighted_results = []
         for candidate, llm_score in scored_candidates:
-            # Get weight for this scraper (default to 1.0 if not specified)
-            weight = SCRAPER_REGISTRY.get(candidate.site_key, {}).get('weight', 1.0)
-
-            # If score is within similarity threshold of best AND above minimum threshold, apply weight
-            if should_apply_weights and (best_llm_score - llm_score <= WEIGHT_SIMILARITY_BRACKET):
+            # If score is within similarity threshold of best, apply weight
+            if best_llm_score - llm_score <= WEIGHT_SIMILARITY_BRACKET:
                 # Apply weight as multiplier (small boost to preserve LLM score primacy)
-                final_score = llm_score * (1.0 + (weight - 1.0) * WEIGHT_BOOST_FACTOR)
-                log.debug(f"Applied weight {weight} to '{candidate.site_key}': "
+                final_score = llm_score * _SCRAPER_BOOSTS.get(candidate.site_key, 1.0)
+                log.debug(f"Applied weight {_SCRAPER_WEIGHTS.get(candidate.site_key, 1.0)} to '{candidate.site_key}': "
                          f"LLM={llm_score:.3f} -> Final={final_score:.3f}")
             else:
-                # Outside quality bracket or scores too low, weight doesn't apply
+                # Outside quality bracket, weight doesn't apply
                 final_score = llm_score
 
             weighted_results.append((candidate, llm_score, final_score))
@@ -180,7 +189,7 @@ class CandidateSelector:
             scored_candidates.append((candidate, score))
         
         # Sort by score (highest first)
-        scored_candidates.sort(key=lambda x: x[1], reverse=True)
+        scored_candidates.sort(key=itemgetter(1), reverse=True)
         
         best_candidate, best_score = scored_candidates[0]
         
@@ -254,7 +263,7 @@ class CandidateSelector:
             scored_candidates.append((candidate, score))
         
         # Sort by score (highest first)
-        scored_candidates.sort(key=lambda x: x[1], reverse=True)
+        scored_candidates.sort(key=itemgetter(1), reverse=True)
         
         return [candidate for candidate, score in scored_candidates]
     
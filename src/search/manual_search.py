@@ -21,6 +21,7 @@ except ImportError:
 
 from ..config import SCRAPER_REGISTRY
 from ..models import BookMetadata
+from ..ui.output import OutputFormatter
 from ..utils import generate_search_term, detect_url_site
 
 
@@ -156,41 +157,7 @@ class ManualSearchHandler:
     
     def _display_book_context(self, search_term: str, book_info: dict = None):
         """Display context about the book being processed."""
-        from ..utils import safe_encode_text
-        print("\n" + "="*80)
-        print(safe_encode_text("📚 MANUAL SEARCH FOR:"))
-        print("="*80)
-
-        if book_info:
-            # Display available metadata
-            if book_info.get('title'):
-                print(safe_encode_text(f"📖 Title: {book_info['title']}"))
-            if book_info.get('author'):
-                print(safe_encode_text(f"✍️  Author: {book_info['author']}"))
-            if book_info.get('series'):
-                series_info = book_info['series']
-                if book_info.get('volume'):
-                    series_info += f" (Volume {book_info['volume']})"
-                print(safe_encode_text(f"📚 Series: {series_info}"))
-            if book_info.get('narrator'):
-                print(safe_encode_text(f"🎤 Narrator: {book_info['narrator']}"))
-            if book_info.get('publisher'):
-                print(safe_encode_text(f"🏢 Publisher: {book_info['publisher']}"))
-            if book_info.get('year'):
-                print(safe_encode_text(f"📅 Year: {book_info['year']}"))
-            if book_info.get('language'):
-                print(safe_encode_text(f"🌍 Language: {book_info['language']}"))
-            if book_info.get('source'):
-                print(safe_encode_text(f"📂 Source: {book_info['source']}"))
-            
-            # Show folder name if different from title
-            if book_info.get('folder_name') and book_info.get('folder_name') != book_info.get('title'):
-                print(safe_encode_text(f"📁 Folder: {book_info['folder_name']}"))
-        else:
-            # Fallback to search term
-            print(safe_encode_text(f"🔍 Search term: {search_term}"))
-        
-        print("="*80)
+        print(OutputFormatter.format_book_context("📚 MANUAL SEARCH FOR:", search_term, book_info))
     
     def _is_valid_url_or_skip(self, text: str) -> bool:
         """Check if text is a valid URL or skip command."""
@@ -0,0 +1,75 @@
+"""
+Tests for scraper weight tiebreaking in src.search.candidate_selection.
+"""
+
+import pytest
+from src.models import SearchCandidate
+from src.search.candidate_selection import CandidateSelector
+
+
+def _candidate(site_key: str) -> SearchCandidate:
+    return SearchCandidate(site_key=site_key, url=f"https://{site_key}.example/book",
+                           title="Book", snippet="")
+
+
+@pytest.mark.unit
+def test_apply_scraper_weights_breaks_ties_by_site():
+    """Test that equal LLM scores are ordered by the registry weight of each scraper."""
+    selector = CandidateSelector()
+    scored = [(_candidate('audible'), 0.8), (_candidate('lubimyczytac'), 0.8),
+              (_candidate('goodreads'), 0.8)]
+
+    weighted = selector._apply_scraper_weights(scored)
+    weighted.sort(key=lambda x: x[2], reverse=True)
+
+    assert [c.site_key for c, _, _ in weighted] == ['lubimyczytac', 'audible', 'goodreads']
+    assert all(llm == 0.8 for _, llm, _ in weighted)
+
+
+@pytest.mark.unit
+def test_apply_scraper_weights_unknown_site_and_low_scores():
+    """Test that unknown scrapers weigh 1.0 and weights are skipped below the minimum score."""
+    selector = CandidateSelector()
+
+    assert selector._apply_scraper_weights([(_candidate('unknown'), 0.9)])[0][2] == 0.9
+    assert selector._apply_scraper_weights([(_candidate('lubimyczytac'), 0.3)])[0][2] == 0.3
+    assert selector._apply_scraper_weights([]) == []
+
+
+@pytest.mark.unit
+def test_apply_scraper_weights_matches_weight_formula():
+    """Test that the precomputed boost equals llm_score * (1 + (weight - 1) * factor)."""
+    from src.config import SCRAPER_REGISTRY, WEIGHT_BOOST_FACTOR
+    selector = CandidateSelector()
+    scored = [(_candidate(site_key), 0.85) for site_key in SCRAPER_REGISTRY]
+
+    for candidate, llm_score, final_score in selector._apply_scraper_weights(scored):
+        weight = SCRAPER_REGISTRY[candidate.site_key].get('weight', 1.0)
+        assert final_score == llm_score * (1.0 + (weight - 1.0) * WEIGHT_BOOST_FACTOR)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("scores", [
+    {'lubimyczytac': 0.0, 'audible': 0.0, 'goodreads': 0.0},
+    {'lubimyczytac': 0.3, 'audible': 0.5, 'goodreads': 0.1},
+])
+def test_zero_scores_do_not_apply_weights(scores):
+    """Test that weights never lift candidates when no score reaches the minimum threshold."""
+    selector = CandidateSelector()
+    scored = [(_candidate(site_key), score) for site_key, score in scores.items()]
+
+    assert all(final == llm for _, llm, final in selector._apply_scraper_weights(scored))
+
+
+@pytest.mark.unit
+def test_good_scores_apply_weights_only_within_bracket():
+    """Test that weights apply to candidates near the best score and not to distant ones."""
+    selector = CandidateSelector()
+    scored = [(_candidate('lubimyczytac'), 0.9), (_candidate('audible'), 0.85),
+              (_candidate('goodreads'), 0.5)]
+
+    finals = {c.site_key: final for c, _, final in selector._apply_scraper_weights(scored)}
+
+    assert finals['lubimyczytac'] > 0.9
+    assert finals['audible'] > 0.85
+    assert finals['goodreads'] == 0.5
@@ -0,0 +1,111 @@
+"""
+Tests for database-backed directory locks.
+
+This module tests FileLockManager's DB lock path used by queue workers:
+mutual exclusion across worker threads, timeouts, and prompt wakeup of
+in-process waiters when a lock is released.
+"""
+
+import time
+import threading
+import pytest
+from pathlib import Path
+from src.queue_manager import QueueManager
+from src.utils.file_locks import FileLockManager
+
+
+@pytest.mark.unit
+def test_db_lock_serializes_workers(test_database, tmp_path):
+    """Test that concurrent workers never hold the same directory lock at once."""
+    target_dir = tmp_path / "Author"
+    holders = []
+    overlaps = []
+    errors = []
+    holders_mutex = threading.Lock()
+
+    # Each worker owns its connection, like Huey worker threads do. Open them
+    # up front so schema initialization doesn't race between threads.
+    queue_managers = [QueueManager() for _ in range(5)]
+
+    def worker(worker_id: int):
+        try:
+            lock_manager = FileLockManager(queue_managers[worker_id].connection)
+            with lock_manager.lock_directory(target_dir, f"task-{worker_id}", timeout=5.0):
+                with holders_mutex:
+                    if holders:
+                        overlaps.append((worker_id, list(holders)))
+                    holders.append(worker_id)
+                target_dir.mkdir(parents=True, exist_ok=True)
+                time.sleep(0.01)
+                with holders_mutex:
+                    holders.remove(worker_id)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    for qm in queue_managers:
+        qm.close()
+
+    assert not errors, f"Workers should acquire the lock: {errors}"
+    assert not overlaps, f"Lock holders should never overlap: {overlaps}"
+    assert target_dir.is_dir(), "Directory should be created under the lock"
+
+
+@pytest.mark.unit
+def test_db_lock_timeout(test_database, tmp_path):
+    """Test that a held lock raises TimeoutError once the timeout expires."""
+    target_dir = tmp_path / "Author"
+    holder_qm = QueueManager()
+    waiter_qm = QueueManager()
+
+    try:
+        holder = FileLockManager(holder_qm.connection)
+        waiter = FileLockManager(waiter_qm.connection)
+
+        with holder.lock_directory(target_dir, "task-holder"):
+            with pytest.raises(TimeoutError):
+                with waiter.lock_directory(target_dir, "task-waiter", timeout=0.2):
+                    pass
+
+        # Released lock can be acquired again
+        with waiter.lock_directory(target_dir, "task-waiter", timeout=0.2):
+            pass
+    finally:
+        holder_qm.close()
+        waiter_qm.close()
+
+
+@pytest.mark.unit
+def test_db_lock_wakes_waiter_on_release(test_database, tmp_path):
+    """Test that an in-process waiter acquires right after release, not after poll_interval."""
+    target_dir = tmp_path / "Author"
+    holder_qm = QueueManager()
+    waiter_qm = QueueManager()
+    acquired_at = []
+
+    try:
+        holder = FileLockManager(holder_qm.connection)
+        waiter = FileLockManager(waiter_qm.connection)
+
+        def wait_for_lock():
+            # Large poll interval: only the release notification can wake us quickly
+            with waiter.lock_directory(target_dir, "task-waiter", timeout=10.0, poll_interval=5.0):
+                acquired_at.append(time.monotonic())
+
+        with holder.lock_directory(target_dir, "task-holder"):
+            thread = threading.Thread(target=wait_for_lock)
+            thread.start()
+            time.sleep(0.2)  # Let the waiter back off to the poll_interval cap
+            released_at = time.monotonic()
+
+        thread.join(timeout=10.0)
+
+        assert acquired_at, "Waiter should acquire the lock after release"
+        assert acquired_at[0] - released_at < 1.0, "Waiter should be woken by the release"
+    finally:
+        holder_qm.close()
+        waiter_qm.close()
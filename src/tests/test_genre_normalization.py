@@ -44,6 +44,8 @@ class TestGenreNormalizer:
         """Test that normalizer creates default mapping if file doesn't exist."""
         missing_file = tmp_path / "nonexistent.json"
         normalizer = GenreNormalizer(mapping_file=missing_file)
+        # Mapping is loaded (and the default file created) on first use
+        assert normalizer.mapping == {}
         assert missing_file.exists()
         # Should have created file with default mapping
         with open(missing_file, 'r', encoding='utf-8') as f:
@@ -137,12 +139,51 @@ class TestGenreNormalizer:
         expected = ["fantasy", "horror", "science fiction", "poland", "romance", "unknown"]
         assert result == expected
 
+    def test_repeated_lists_return_independent_copies(self, normalizer):
+        """Test that repeated genre lists give equal results that callers may mutate."""
+        first = normalizer.normalize_genres(["Fantasy", "romans"])
+        first.append("mutated")
+
+        assert normalizer.normalize_genres(["Fantasy", "romans"]) == ["fantasy", "romance"]
+
+    def test_find_canonical_genre_normalizes_raw_input(self, normalizer):
+        """Test that the public single-genre lookup strips and lowercases its input."""
+        assert normalizer.find_canonical_genre("  Sci-Fi ") == "science fiction"
+        assert normalizer.find_canonical_genre("Unknown") == "unknown"
+
+    def test_punctuation_variants_match_without_listing(self, normalizer):
+        """Test that unlisted punctuation/whitespace variants map like the listed form."""
+        result = normalizer.normalize_genres(["Sci Fi", "sci_fi", "Science-Fiction", "Romance."])
+        assert result == ["science fiction", "romance"]
+
+    def test_exact_names_win_over_folded_variants(self, normalizer):
+        """Test that an exact mapping entry is preferred over a punctuation-folded match."""
+        normalizer.add_mapping("sci fi", [])
+        assert normalizer.normalize_genres(["sci fi", "sci-fi"]) == ["sci fi", "science fiction"]
+
     def test_canonical_genre_with_empty_alternatives(self, normalizer):
         """Test that canonical genres with no alternatives (like 'horror': []) work correctly."""
         result = normalizer.normalize_genres(["horror", "Horror", "HORROR"])
         assert result == ["horror"]
 
 
+    def test_lazy_load_publishes_mapping_after_indexes(self, temp_mapping_file):
+        """Test that the loaded mapping becomes visible only once its lookup indexes are built."""
+        normalizer = GenreNormalizer(mapping_file=temp_mapping_file)
+        rebuild = normalizer._rebuild_alt_index
+        seen_while_building = []
+
+        def spy(mapping):
+            seen_while_building.append(normalizer._mapping)
+            rebuild(mapping)
+
+        normalizer._rebuild_alt_index = spy
+        normalizer.mapping
+
+        assert seen_while_building == [None]
+        assert normalizer.find_canonical_genre("sci-fi") == "science fiction"
+
+
 class TestGenreNormalizerAddMapping:
     """Test the add_mapping and save_mapping functionality."""
 
@@ -162,6 +203,12 @@ class TestGenreNormalizerAddMapping:
         assert "romans" in normalizer.mapping["romance"]
         assert "love" in normalizer.mapping["romance"]
 
+    def test_update_existing_mapping_preserves_order(self, normalizer):
+        """Test that merged alternatives keep their order and are not duplicated."""
+        normalizer.add_mapping("romance", ["Love", "romcom", "slow burn", "romcom"])
+        assert normalizer.mapping["romance"] == ["romans", "romantasy", "love", "romcom", "slow burn"]
+        assert normalizer.normalize_genres(["Slow Burn"]) == ["romance"]
+
     def test_add_mapping_normalizes_case(self, normalizer):
         """Test that add_mapping lowercases all inputs."""
         normalizer.add_mapping("ADVENTURE", ["ACTION", "Quest"])
@@ -169,6 +216,27 @@ class TestGenreNormalizerAddMapping:
         assert "action" in normalizer.mapping["adventure"]
         assert "quest" in normalizer.mapping["adventure"]
 
+    def test_added_mappings_are_used_for_lookup(self, normalizer):
+        """Test that alternatives added at runtime are resolved immediately."""
+        normalizer.add_mapping("adventure", ["quest"])
+        normalizer.add_alternative_to_existing("horror", "grimdark")
+
+        assert normalizer.normalize_genres(["Quest", "GrimDark"]) == ["adventure", "horror"]
+
+    def test_mapping_changes_invalidate_cached_lookups(self, normalizer):
+        """Test that previously normalized genres pick up later mapping changes."""
+        assert normalizer.normalize_genres(["Grimdark"]) == ["grimdark"]
+
+        normalizer.add_alternative_to_existing("horror", "grimdark")
+
+        assert normalizer.normalize_genres(["Grimdark"]) == ["horror"]
+
+    def test_canonical_takes_precedence_over_alternative(self, normalizer):
+        """Test that a genre that is both canonical and an alternative stays canonical."""
+        normalizer.add_mapping("space", [])
+
+        assert normalizer.normalize_genres(["Space", "sf"]) == ["space", "science fiction"]
+
     def test_save_mapping(self, normalizer, temp_mapping_file):
         """Test saving mapping to file."""
         normalizer.add_mapping("adventure", ["action"])
@@ -182,6 +250,35 @@ class TestGenreNormalizerAddMapping:
         assert "action" in saved_mapping["adventure"]
 
 
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_save_and_reload_with_either_json_backend(temp_mapping_file, monkeypatch, use_orjson):
+    """Test that mapping files round-trip identically with orjson and the stdlib fallback."""
+    import src.utils.genre_normalizer as gnorm
+    if use_orjson and not gnorm.HAS_ORJSON:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(gnorm, "HAS_ORJSON", use_orjson)
+
+    normalizer = GenreNormalizer(mapping_file=temp_mapping_file)
+    normalizer.add_mapping("komedia", ["śmieszne"])
+    normalizer.save_mapping()
+
+    reloaded = GenreNormalizer(mapping_file=temp_mapping_file)
+    assert reloaded.mapping["komedia"] == ["śmieszne"]
+    assert "śmieszne" in temp_mapping_file.read_text(encoding='utf-8')
+
+
+def test_streaming_load_matches_regular_load(temp_mapping_file, monkeypatch):
+    """Test that stream-parsing a large mapping file yields the same mapping."""
+    import src.utils.genre_normalizer as gnorm
+    if not gnorm.HAS_IJSON:
+        pytest.skip("ijson not installed")
+
+    expected = GenreNormalizer(mapping_file=temp_mapping_file).mapping
+    monkeypatch.setattr(GenreNormalizer, "STREAMING_LOAD_THRESHOLD", 0)
+
+    assert GenreNormalizer(mapping_file=temp_mapping_file).mapping == expected
+
+
 class TestGlobalNormalizeFunction:
     """Test the module-level normalize_genres function."""
 
@@ -2,7 +2,7 @@
 Tests for LLM-based genre categorization.
 
 This module tests the LLM integration for automatic genre categorization,
-including connection testing, categorization logic, and error handling.
+including configuration checks, categorization logic, and error handling.
 """
 
 import json
@@ -58,24 +58,25 @@ class TestLLMConnection:
             assert normalizer.llm_available is False
 
     @patch('litellm.completion')
-    def test_llm_connection_success(self, mock_completion, temp_mapping_file, mock_llm_config):
-        """Test successful LLM connection during initialization."""
-        mock_completion.return_value = MagicMock(
-            choices=[MagicMock(message=MagicMock(content="OK"), finish_reason="stop")]
-        )
-
+    def test_llm_available_without_connection_ping(self, mock_completion, temp_mapping_file, mock_llm_config):
+        """Test that a configured LLM is available without a connection test request."""
         normalizer = GenreNormalizer(mapping_file=temp_mapping_file, use_llm=True)
         assert normalizer.llm_available is True
-        mock_completion.assert_called_once()
+        mock_completion.assert_not_called()
 
     @patch('litellm.completion')
-    def test_llm_connection_failure(self, mock_completion, temp_mapping_file, mock_llm_config):
-        """Test LLM connection failure during initialization."""
+    def test_llm_connection_failure_on_first_request(self, mock_completion, temp_mapping_file, mock_llm_config):
+        """Test that a failing first request disables the LLM and genres pass through."""
         mock_completion.side_effect = Exception("Connection failed")
 
         normalizer = GenreNormalizer(mapping_file=temp_mapping_file, use_llm=True)
+        assert normalizer.normalize_genres(["space opera", "fantasy"]) == ["space opera", "fantasy"]
         assert normalizer.llm_available is False
 
+        # Later unmapped genres short-circuit without further requests
+        assert normalizer.normalize_genres(["cyberpunk", "noir"]) == ["cyberpunk", "noir"]
+        assert mock_completion.call_count == 1
+
 
 class TestLLMCategorization:
     """Tests for LLM genre categorization logic."""
@@ -83,9 +84,8 @@ class TestLLMCategorization:
     @patch('litellm.completion')
     def test_llm_categorizes_subgenre_to_main_genre(self, mock_completion, temp_mapping_file, mock_llm_config):
         """Test that LLM correctly categorizes a subgenre to a main genre."""
-        # Setup: LLM connection succeeds, then categorizes "cyberpunk" as "science fiction"
+        # Setup: LLM categorizes "cyberpunk" as "science fiction"
         mock_completion.side_effect = [
-            MagicMock(choices=[MagicMock(message=MagicMock(content="OK"), finish_reason="stop")]),  # Connection test
             MagicMock(choices=[MagicMock(message=MagicMock(content="science fiction"), finish_reason="stop")])  # Categorization
         ]
 
@@ -100,9 +100,8 @@ class TestLLMCategorization:
     @patch('litellm.completion')
     def test_llm_returns_no_match(self, mock_completion, temp_mapping_file, mock_llm_config):
         """Test that LLM correctly returns no match for unrelated genre."""
-        # Setup: LLM connection succeeds, then returns "NO_FIT" for no match
+        # Setup: LLM returns "NO_FIT" for no match
         mock_completion.side_effect = [
-            MagicMock(choices=[MagicMock(message=MagicMock(content="OK"), finish_reason="stop")]),  # Connection test
             MagicMock(choices=[MagicMock(message=MagicMock(content="NO_FIT"), finish_reason="stop")])  # No match
         ]
 
@@ -118,9 +117,8 @@ class TestLLMCategorization:
     @patch('litellm.completion')
     def test_llm_invalid_response_raises_exception(self, mock_completion, temp_mapping_file, mock_llm_config):
         """Test that invalid LLM response raises exception."""
-        # Setup: LLM connection succeeds, then returns invalid response
+        # Setup: LLM returns invalid response
         mock_completion.side_effect = [
-            MagicMock(choices=[MagicMock(message=MagicMock(content="OK"), finish_reason="stop")]),  # Connection test
             MagicMock(choices=[MagicMock(message=MagicMock(content="invalid category"), finish_reason="stop")])  # Invalid
         ]
 
@@ -134,13 +132,14 @@ class TestLLMCategorization:
     @patch('litellm.completion')
     def test_llm_error_during_categorization(self, mock_completion, temp_mapping_file, mock_llm_config):
         """Test that errors during categorization raise exception."""
-        # Setup: LLM connection succeeds, then fails during categorization
+        # Setup: LLM works for the first genre, then fails during categorization
         mock_completion.side_effect = [
-            MagicMock(choices=[MagicMock(message=MagicMock(content="OK"), finish_reason="stop")]),  # Connection test
+            MagicMock(choices=[MagicMock(message=MagicMock(content="science fiction"), finish_reason="stop")]),
             Exception("API error")  # Categorization fails
         ]
 
         normalizer = GenreNormalizer(mapping_file=temp_mapping_file, use_llm=True)
+        normalizer.normalize_genres(["cyberpunk"])
         genres = ["space opera"]
 
         # Should raise exception since LLM failed
@@ -150,9 +149,8 @@ class TestLLMCategorization:
     @patch('litellm.completion')
     def test_llm_incomplete_response_raises_exception(self, mock_completion, temp_mapping_file, mock_llm_config):
         """Test that incomplete LLM response (finish_reason != 'stop') raises exception."""
-        # Setup: LLM connection succeeds, then returns incomplete response
+        # Setup: LLM returns incomplete response
         mock_completion.side_effect = [
-            MagicMock(choices=[MagicMock(message=MagicMock(content="OK"), finish_reason="stop")]),  # Connection test
             MagicMock(choices=[MagicMock(message=MagicMock(content="partial"), finish_reason="length")])  # Incomplete
         ]
 
@@ -166,9 +164,8 @@ class TestLLMCategorization:
     @patch('litellm.completion')
     def test_llm_categorization_saves_mapping(self, mock_completion, temp_mapping_file, mock_llm_config):
         """Test that LLM categorization results are saved to mapping file."""
-        # Setup: LLM connection succeeds, then categorizes
+        # Setup: LLM categorizes
         mock_completion.side_effect = [
-            MagicMock(choices=[MagicMock(message=MagicMock(content="OK"), finish_reason="stop")]),  # Connection test
             MagicMock(choices=[MagicMock(message=MagicMock(content="mystery"), finish_reason="stop")])  # Categorization
         ]
 
@@ -182,6 +179,77 @@ class TestLLMCategorization:
         assert "cozy mystery" in saved_mapping["mystery"]
 
 
+class TestLLMBatchCategorization:
+    """Tests for categorizing several unmapped genres in one LLM request."""
+
+    @patch('litellm.completion')
+    def test_unmapped_genres_share_one_request(self, mock_completion, temp_mapping_file, mock_llm_config):
+        """Test that all unmapped genres of a book are categorized with a single request."""
+        batch_answer = '```json\n{"cyberpunk": "science fiction", "cozy mystery": "Mystery", "haiku": "NO_FIT"}\n```'
+        mock_completion.side_effect = [
+            MagicMock(choices=[MagicMock(message=MagicMock(content=batch_answer), finish_reason="stop")])  # Batch
+        ]
+
+        normalizer = GenreNormalizer(mapping_file=temp_mapping_file, use_llm=True)
+        result = normalizer.normalize_genres(["Cyberpunk", "fantasy", "Cozy Mystery", "Haiku"])
+
+        assert result == ["science fiction", "fantasy", "mystery", "haiku"]
+        assert mock_completion.call_count == 1
+        prompt = mock_completion.call_args_list[0][1]['messages'][0]['content']
+        assert '"cyberpunk"' in prompt and '"cozy mystery"' in prompt and '"haiku"' in prompt
+
+        with open(temp_mapping_file, 'r', encoding='utf-8') as f:
+            saved_mapping = json.load(f)
+        assert "cyberpunk" in saved_mapping["science fiction"]
+        assert "cozy mystery" in saved_mapping["mystery"]
+        assert saved_mapping["haiku"] == []
+
+    @patch('litellm.completion')
+    def test_batch_saves_mapping_once(self, mock_completion, temp_mapping_file, mock_llm_config):
+        """Test that several LLM-driven mapping changes are written with a single atomic save."""
+        batch_answer = '{"cyberpunk": "science fiction", "haiku": "NO_FIT", "noir": "mystery"}'
+        mock_completion.side_effect = [
+            MagicMock(choices=[MagicMock(message=MagicMock(content=batch_answer), finish_reason="stop")])  # Batch
+        ]
+
+        normalizer = GenreNormalizer(mapping_file=temp_mapping_file, use_llm=True)
+        with patch.object(normalizer, 'save_mapping', wraps=normalizer.save_mapping) as mock_save:
+            normalizer.normalize_genres(["cyberpunk", "haiku", "noir"])
+
+        assert mock_save.call_count == 1
+        assert not temp_mapping_file.with_suffix('.json.tmp').exists()
+        with open(temp_mapping_file, 'r', encoding='utf-8') as f:
+            assert "noir" in json.load(f)["mystery"]
+
+    @patch('litellm.completion')
+    def test_invalid_batch_answer_fails_only_that_genre(self, mock_completion, temp_mapping_file, mock_llm_config):
+        """Test that a genre with an invalid answer fails while valid answers are kept."""
+        batch_answer = '{"cyberpunk": "science fiction", "space opera": "not a category"}'
+        mock_completion.side_effect = [
+            MagicMock(choices=[MagicMock(message=MagicMock(content=batch_answer), finish_reason="stop")])  # Batch
+        ]
+
+        normalizer = GenreNormalizer(mapping_file=temp_mapping_file, use_llm=True)
+
+        with pytest.raises(Exception, match="LLM failed to categorize genres: Space Opera$"):
+            normalizer.normalize_genres(["Cyberpunk", "Space Opera"])
+
+        assert "cyberpunk" in normalizer.mapping["science fiction"]
+        assert "space opera" not in normalizer.mapping
+
+    @patch('litellm.completion')
+    def test_unparseable_batch_response_fails_all(self, mock_completion, temp_mapping_file, mock_llm_config):
+        """Test that a non-JSON batch response fails every genre in the batch."""
+        mock_completion.side_effect = [
+            MagicMock(choices=[MagicMock(message=MagicMock(content="science fiction"), finish_reason="stop")])
+        ]
+
+        normalizer = GenreNormalizer(mapping_file=temp_mapping_file, use_llm=True)
+
+        with pytest.raises(Exception, match="LLM failed to categorize genres: cyberpunk, space opera"):
+            normalizer.normalize_genres(["cyberpunk", "fantasy", "space opera"])
+
+
 class TestLLMPromptGeneration:
     """Tests for LLM prompt generation."""
 
@@ -189,15 +257,14 @@ class TestLLMPromptGeneration:
     def test_prompt_includes_all_existing_genres(self, mock_completion, temp_mapping_file, mock_llm_config):
         """Test that the LLM prompt includes all existing genre mappings."""
         mock_completion.side_effect = [
-            MagicMock(choices=[MagicMock(message=MagicMock(content="OK"), finish_reason="stop")]),  # Connection test
             MagicMock(choices=[MagicMock(message=MagicMock(content="NO_FIT"), finish_reason="stop")])  # No match
         ]
 
         normalizer = GenreNormalizer(mapping_file=temp_mapping_file, use_llm=True)
         normalizer.normalize_genres(["new genre"])
 
-        # Get the categorization call (second call)
-        categorization_call = mock_completion.call_args_list[1]
+        # Get the categorization call (no separate connection test call)
+        categorization_call = mock_completion.call_args_list[0]
         prompt = categorization_call[1]['messages'][0]['content']
 
         # Verify prompt contains existing mappings
@@ -211,7 +278,6 @@ class TestLLMPromptGeneration:
     def test_prompt_includes_confidence_threshold(self, mock_completion, temp_mapping_file, mock_llm_config):
         """Test that the LLM prompt mentions the confidence threshold."""
         mock_completion.side_effect = [
-            MagicMock(choices=[MagicMock(message=MagicMock(content="OK"), finish_reason="stop")]),  # Connection test
             MagicMock(choices=[MagicMock(message=MagicMock(content="NO_FIT"), finish_reason="stop")])  # No match
         ]
 
@@ -219,7 +285,7 @@ class TestLLMPromptGeneration:
         normalizer.normalize_genres(["new genre"])
 
         # Get the categorization call
-        categorization_call = mock_completion.call_args_list[1]
+        categorization_call = mock_completion.call_args_list[0]
         prompt = categorization_call[1]['messages'][0]['content']
 
         # Verify prompt mentions 85% confidence
@@ -232,9 +298,8 @@ class TestLLMIntegration:
     @patch('litellm.completion')
     def test_mixed_mapped_and_unmapped_genres(self, mock_completion, temp_mapping_file, mock_llm_config):
         """Test normalization with mix of mapped and unmapped genres."""
-        # Setup: LLM connection succeeds, then categorizes unmapped genre
+        # Setup: LLM categorizes unmapped genre
         mock_completion.side_effect = [
-            MagicMock(choices=[MagicMock(message=MagicMock(content="OK"), finish_reason="stop")]),  # Connection test
             MagicMock(choices=[MagicMock(message=MagicMock(content="science fiction"), finish_reason="stop")])  # Categorization
         ]
 
@@ -248,16 +313,27 @@ class TestLLMIntegration:
     @patch('litellm.completion')
     def test_llm_not_called_for_mapped_genres(self, mock_completion, temp_mapping_file, mock_llm_config):
         """Test that LLM is not called when all genres are already mapped."""
-        mock_completion.side_effect = [
-            MagicMock(choices=[MagicMock(message=MagicMock(content="OK"), finish_reason="stop")])  # Only connection test
-        ]
+        mock_completion.side_effect = []
 
         normalizer = GenreNormalizer(mapping_file=temp_mapping_file, use_llm=True)
         genres = ["sci-fi", "fantastyka", "romans"]  # All are mapped
         result = normalizer.normalize_genres(genres)
 
         assert result == ["science fiction", "fantasy", "romance"]
-        # Should only have been called once (for connection test)
+        assert mock_completion.call_count == 0
+
+    @patch('litellm.completion')
+    def test_llm_consulted_once_for_case_variants(self, mock_completion, temp_mapping_file, mock_llm_config):
+        """Test that case/whitespace variants of one unmapped genre cause a single LLM request."""
+        mock_completion.side_effect = [
+            MagicMock(choices=[MagicMock(message=MagicMock(content="invalid category"), finish_reason="stop")])
+        ]
+
+        normalizer = GenreNormalizer(mapping_file=temp_mapping_file, use_llm=True)
+
+        with pytest.raises(Exception, match="LLM failed to categorize genres: Space Opera$"):
+            normalizer.normalize_genres(["Space Opera", "space opera ", "Space Opera"])
+
         assert mock_completion.call_count == 1
 
     @patch('litellm.completion')
@@ -265,7 +341,6 @@ class TestLLMIntegration:
         """Test that LLM categorization results persist when creating new normalizer instance."""
         # First instance: categorize "cyberpunk"
         mock_completion.side_effect = [
-            MagicMock(choices=[MagicMock(message=MagicMock(content="OK"), finish_reason="stop")]),  # Connection test
             MagicMock(choices=[MagicMock(message=MagicMock(content="science fiction"), finish_reason="stop")])  # Categorization
         ]
 
@@ -274,16 +349,58 @@ class TestLLMIntegration:
 
         # Second instance: "cyberpunk" should now be mapped, no LLM call needed
         mock_completion.reset_mock()
+        mock_completion.side_effect = []
+
+        normalizer2 = GenreNormalizer(mapping_file=temp_mapping_file, use_llm=True)
+        result = normalizer2.normalize_genres(["cyberpunk"])
+
+        assert result == ["science fiction"]
+        # Should not call LLM for categorization
+        assert mock_completion.call_count == 0
+
+
+class TestLLMDecisionCache:
+    """Tests for the on-disk cache of LLM decisions."""
+
+    @patch('litellm.completion')
+    def test_llm_decisions_reused_across_runs(self, mock_completion, temp_mapping_file, mock_llm_config):
+        """Test that a decision is reused from the cache file instead of asking the LLM again."""
+        original_mapping = temp_mapping_file.read_text(encoding='utf-8')
         mock_completion.side_effect = [
-            MagicMock(choices=[MagicMock(message=MagicMock(content="OK"), finish_reason="stop")])  # Only connection test
+            MagicMock(choices=[MagicMock(message=MagicMock(content="science fiction"), finish_reason="stop")])  # Categorization
         ]
 
-        normalizer2 = GenreNormalizer(mapping_file=temp_mapping_file, use_llm=True)
+        normalizer1 = GenreNormalizer(mapping_file=temp_mapping_file, use_llm=True)
+        normalizer1.normalize_genres(["cyberpunk"])
+        assert (temp_mapping_file.parent / GenreNormalizer.LLM_CACHE_FILENAME).exists()
+
+        # Fresh mapping without "cyberpunk" in the same directory - decision comes from cache
+        fresh_mapping_file = temp_mapping_file.with_name("fresh_mapping.json")
+        fresh_mapping_file.write_text(original_mapping, encoding='utf-8')
+        mock_completion.reset_mock()
+        mock_completion.side_effect = []
+
+        normalizer2 = GenreNormalizer(mapping_file=fresh_mapping_file, use_llm=True)
         result = normalizer2.normalize_genres(["cyberpunk"])
 
         assert result == ["science fiction"]
-        # Should only call for connection test, not categorization
-        assert mock_completion.call_count == 1
+        assert "cyberpunk" in normalizer2.mapping["science fiction"]
+        assert mock_completion.call_count == 0
+
+    def test_llm_decisions_written_on_flush(self, temp_mapping_file):
+        """Test that decisions are buffered until flush_mapping and then written atomically."""
+        cache_file = temp_mapping_file.parent / GenreNormalizer.LLM_CACHE_FILENAME
+        normalizer = GenreNormalizer(mapping_file=temp_mapping_file, use_llm=True)
+
+        normalizer._store_llm_decisions("test-model", {"cyberpunk": "science fiction", "knitting": None})
+        assert not cache_file.exists()
+
+        normalizer.flush_mapping()
+        assert json.loads(cache_file.read_text(encoding='utf-8')) == {
+            "test-model::cyberpunk": "science fiction",
+            "test-model::knitting": "NO_FIT",
+        }
+        assert not cache_file.with_name(cache_file.name + '.tmp').exists()
 
 
 class TestConfidenceThreshold:
@@ -311,7 +428,6 @@ class TestConfidenceThreshold:
         GenreNormalizer.LLM_CONFIDENCE_THRESHOLD = 0.90
 
         mock_completion.side_effect = [
-            MagicMock(choices=[MagicMock(message=MagicMock(content="OK"), finish_reason="stop")]),  # Connection test
             MagicMock(choices=[MagicMock(message=MagicMock(content="NO_FIT"), finish_reason="stop")])  # No match
         ]
 
@@ -319,7 +435,7 @@ class TestConfidenceThreshold:
         normalizer.normalize_genres(["new genre"])
 
         # Get the categorization call
-        categorization_call = mock_completion.call_args_list[1]
+        categorization_call = mock_completion.call_args_list[0]
         prompt = categorization_call[1]['messages'][0]['content']
 
         # Verify prompt mentions 90% confidence
@@ -329,47 +445,73 @@ class TestConfidenceThreshold:
         GenreNormalizer.LLM_CONFIDENCE_THRESHOLD = original_threshold
 
 
+@pytest.fixture
+def fresh_global_normalizer(monkeypatch):
+    """Reset the shared normalizers before and after a test."""
+    import src.utils.genre_normalizer as gnorm
+
+    gnorm._make_normalizer.cache_clear()
+    monkeypatch.setattr(gnorm, '_llm_requested', False)
+    yield gnorm
+    gnorm._make_normalizer.cache_clear()
+
+
 class TestGlobalSingleton:
-    """Tests for global singleton pattern with LLM."""
+    """Tests for the shared normalizer instances with LLM."""
 
-    def test_get_normalizer_without_llm(self, temp_mapping_file):
+    def test_get_normalizer_without_llm(self, fresh_global_normalizer):
         """Test that get_normalizer creates instance without LLM by default."""
-        from src.utils.genre_normalizer import _normalizer, get_normalizer
-
-        # Reset global instance
-        import src.utils.genre_normalizer as gnorm
-        original_normalizer = gnorm._normalizer
-        gnorm._normalizer = None
-
-        try:
-            with patch('src.utils.genre_normalizer.GenreNormalizer.__init__', return_value=None) as mock_init:
-                normalizer = get_normalizer(use_llm=False)
-                mock_init.assert_called_once_with(use_llm=False)
-        finally:
-            # Restore original normalizer to prevent test pollution
-            gnorm._normalizer = original_normalizer
-
-    def test_get_normalizer_with_llm_creates_new_instance(self, temp_mapping_file):
+        gnorm = fresh_global_normalizer
+
+        with patch('src.utils.genre_normalizer.GenreNormalizer.__init__', return_value=None) as mock_init:
+            normalizer = gnorm.get_normalizer(use_llm=False)
+            assert gnorm.get_normalizer(use_llm=False) is normalizer
+            mock_init.assert_called_once_with(use_llm=False)
+
+    def test_get_normalizer_with_llm_creates_new_instance(self, fresh_global_normalizer):
         """Test that requesting LLM creates new instance even if one exists."""
-        from src.utils.genre_normalizer import get_normalizer
-        import src.utils.genre_normalizer as gnorm
-
-        # Reset and create non-LLM instance
-        original_normalizer = gnorm._normalizer
-        gnorm._normalizer = None
-
-        try:
-            normalizer1 = get_normalizer(use_llm=False)
-            assert normalizer1 is not None
-
-            # Request LLM instance - should create new one
-            with patch('src.utils.genre_normalizer.GenreNormalizer') as mock_class:
-                mock_instance = Mock()
-                mock_instance.use_llm = True
-                mock_class.return_value = mock_instance
-
-                normalizer2 = get_normalizer(use_llm=True)
-                mock_class.assert_called_with(use_llm=True)
-        finally:
-            # Restore original normalizer to prevent test pollution
-            gnorm._normalizer = original_normalizer
+        gnorm = fresh_global_normalizer
+
+        normalizer1 = gnorm.get_normalizer(use_llm=False)
+        assert normalizer1 is not None
+
+        # Request LLM instance - should create new one
+        with patch('src.utils.genre_normalizer.GenreNormalizer') as mock_class:
+            mock_instance = Mock()
+            mock_instance.use_llm = True
+            mock_class.return_value = mock_instance
+
+            normalizer2 = gnorm.get_normalizer(use_llm=True)
+            mock_class.assert_called_with(use_llm=True)
+            assert normalizer2 is mock_instance
+
+            # Plain requests now share the LLM instance (same mapping for OPF and tags)
+            assert gnorm.get_normalizer(use_llm=False) is mock_instance
+
+    def test_get_normalizer_concurrent_calls_share_one_instance(self, fresh_global_normalizer):
+        """Test that concurrent first calls construct a single shared instance."""
+        import threading
+        gnorm = fresh_global_normalizer
+
+        barrier = threading.Barrier(8)
+        results = []
+        init_calls = []
+
+        def fake_init(self, mapping_file=None, use_llm=False):
+            init_calls.append(use_llm)
+            self.use_llm = use_llm
+
+        def worker():
+            barrier.wait()
+            results.append(gnorm.get_normalizer(use_llm=False))
+
+        with patch('src.utils.genre_normalizer.GenreNormalizer.__init__', fake_init):
+            threads = [threading.Thread(target=worker) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert init_calls == [False]
+        assert len(results) == 8
+        assert len({id(normalizer) for normalizer in results}) == 1
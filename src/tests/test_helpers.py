@@ -0,0 +1,199 @@
+"""
+Tests for folder and formatting helpers in src.utils.helpers.
+"""
+
+import pytest
+from pathlib import Path
+from unittest.mock import patch
+from src.utils.helpers import (
+    scan_folder, get_folder_size, find_audio_files, find_metadata_opf,
+    format_file_size, format_duration, wait_with_backoff, validate_path, clean_filename,
+    _natural_sort_key
+)
+
+
+@pytest.fixture
+def nested_book(tmp_path):
+    """Create a nested audiobook folder: Book/CD1/{01.mp3, 02.MP3, metadata.opf, cover.jpg}."""
+    book = tmp_path / "Book"
+    disc = book / "CD1"
+    disc.mkdir(parents=True)
+    (disc / "01.mp3").write_bytes(b"a" * 100)
+    (disc / "02.MP3").write_bytes(b"b" * 50)
+    (disc / "metadata.opf").write_text("<package/>", encoding="utf-8")
+    (disc / "cover.jpg").write_bytes(b"c" * 10)
+    return book
+
+
+@pytest.mark.unit
+def test_scan_folder_matches_separate_helpers(tmp_path):
+    """Test that one scan reports the same size, audio files and OPF as the individual helpers."""
+    book = tmp_path / "Book"
+    (book / "CD1").mkdir(parents=True)
+    (book / "CD2").mkdir()
+    (book / "CD1" / "01.mp3").write_bytes(b"a" * 100)
+    (book / "CD1" / "02.mp3").write_bytes(b"b" * 50)
+    (book / "CD1" / "metadata.opf").write_text("<package/>", encoding="utf-8")
+    (book / "CD2" / "01.m4b").write_bytes(b"c" * 25)
+    (book / "cover.jpg").write_bytes(b"d" * 10)
+
+    scan = scan_folder(book)
+
+    assert scan.total_size == get_folder_size(book)
+    assert scan.metadata_opf == find_metadata_opf(book)
+    assert list(scan.audio_files) == find_audio_files(book)
+
+
+@pytest.mark.unit
+def test_scan_folder_audio_files_sorted_case_insensitive(nested_book):
+    """Test that audio extensions match case-insensitively and results are sorted."""
+    scan = scan_folder(nested_book)
+
+    assert [f.name for f in scan.audio_files] == ["01.mp3", "02.MP3"]
+
+
+@pytest.mark.unit
+def test_scan_folder_prefers_direct_opf(nested_book):
+    """Test that a metadata.opf directly in the folder wins over nested ones."""
+    direct_opf = nested_book / "metadata.opf"
+    direct_opf.write_text("<package/>", encoding="utf-8")
+
+    assert scan_folder(nested_book).metadata_opf == direct_opf
+
+
+@pytest.mark.unit
+def test_scan_folder_missing_folder(tmp_path):
+    """Test that a missing folder yields an empty scan instead of raising."""
+    scan = scan_folder(tmp_path / "missing")
+
+    assert scan.total_size == 0
+    assert scan.audio_files == ()
+    assert scan.metadata_opf is None
+
+
+@pytest.mark.unit
+def test_find_metadata_opf_nested_audio_folder(tmp_path):
+    """Test that the OPF next to nested audio files is found, skipping audio-only folders."""
+    book = tmp_path / "Author" / "Book - Author"
+    (book / "Book").mkdir(parents=True)
+    (book / "extras").mkdir()
+    (book / "extras" / "bonus.mp3").write_bytes(b"")
+    (book / "Book" / "01.m4b").write_bytes(b"")
+    (book / "Book" / "metadata.opf").write_text("<package/>", encoding="utf-8")
+
+    assert find_metadata_opf(tmp_path / "Author") == book / "Book" / "metadata.opf"
+    assert scan_folder(tmp_path / "Author").metadata_opf == book / "Book" / "metadata.opf"
+
+
+@pytest.mark.unit
+def test_find_metadata_opf_prefers_shallowest_audio_folder(tmp_path):
+    """Test that both lookups pick the shallower OPF even when a deeper one sorts first."""
+    (tmp_path / "A" / "Deep").mkdir(parents=True)
+    (tmp_path / "A" / "Deep" / "x.mp3").write_bytes(b"")
+    (tmp_path / "A" / "Deep" / "metadata.opf").write_text("<package/>", encoding="utf-8")
+    (tmp_path / "Z").mkdir()
+    (tmp_path / "Z" / "y.mp3").write_bytes(b"")
+    (tmp_path / "Z" / "metadata.opf").write_text("<package/>", encoding="utf-8")
+
+    assert find_metadata_opf(tmp_path) == tmp_path / "Z" / "metadata.opf"
+    assert scan_folder(tmp_path).metadata_opf == tmp_path / "Z" / "metadata.opf"
+
+
+@pytest.mark.unit
+def test_find_metadata_opf_none_without_audio(tmp_path):
+    """Test that a nested OPF without audio files beside it is ignored."""
+    (tmp_path / "notes").mkdir()
+    (tmp_path / "notes" / "metadata.opf").write_text("<package/>", encoding="utf-8")
+
+    assert find_metadata_opf(tmp_path) is None
+
+
+@pytest.mark.unit
+def test_natural_sort_key_orders_track_numbers():
+    """Test that track numbers sort numerically so track 1 is probed first."""
+    files = [Path("Book/10 - Ten.mp3"), Path("Book/2 - Two.mp3"), Path("Book/1 - One.mp3")]
+
+    assert sorted(files, key=_natural_sort_key)[0].name == "1 - One.mp3"
+    assert [f.name for f in sorted(files, key=_natural_sort_key)] == [
+        "1 - One.mp3", "2 - Two.mp3", "10 - Ten.mp3"
+    ]
+
+
+@pytest.mark.unit
+def test_natural_sort_key_keeps_superscript_digits_as_text():
+    """Test that digit-like characters outside \\d (such as '²') don't break the sort key."""
+    files = [Path("Book/Part 2.mp3"), Path("Book/Part 1².mp3")]
+
+    assert [f.name for f in sorted(files, key=_natural_sort_key)] == ["Part 1².mp3", "Part 2.mp3"]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("size_bytes,expected", [
+    (0, "0 B"),
+    (1, "1.0 B"),
+    (1023, "1023.0 B"),
+    (1024, "1.0 KB"),
+    (1536, "1.5 KB"),
+    (1024 ** 2, "1.0 MB"),
+    (5 * 1024 ** 3, "5.0 GB"),
+    (2048 * 1024 ** 4, "2048.0 TB"),
+])
+def test_format_file_size(size_bytes, expected):
+    """Test human-readable sizes across unit boundaries."""
+    assert format_file_size(size_bytes) == expected
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("seconds,expected", [
+    (0, "0.0s"),
+    (59.94, "59.9s"),
+    (60, "1m 0s"),
+    (187.6, "3m 7s"),
+    (3600, "1h 0m"),
+    (3900.5, "1h 5m"),
+])
+def test_format_duration(seconds, expected):
+    """Test human-readable durations for seconds, minutes and hours."""
+    assert format_duration(seconds) == expected
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("attempt,nominal", [(1, 2.0), (2, 3.0), (3, 4.5), (5, 10.0), (50, 10.0)])
+def test_wait_with_backoff_jittered_schedule(attempt, nominal):
+    """Test that back-off follows the x1.5 schedule within +/-20% jitter, capped at max_delay."""
+    with patch('src.utils.helpers.time.sleep') as mock_sleep:
+        delay = wait_with_backoff(attempt)
+
+    mock_sleep.assert_called_once_with(delay)
+    assert nominal * 0.8 <= delay <= min(nominal * 1.2, 10.0)
+
+
+@pytest.mark.unit
+def test_wait_with_backoff_custom_delays():
+    """Test that non-default base/max delays use the same formula."""
+    with patch('src.utils.helpers.time.sleep'):
+        delay = wait_with_backoff(3, base_delay=1.0, max_delay=60.0)
+
+    assert 2.25 * 0.8 <= delay <= 2.25 * 1.2
+
+
+@pytest.mark.unit
+def test_validate_path_strips_trailing_quotes_and_separators(tmp_path):
+    """Test that pasted paths lose trailing quotes/separators and existing paths resolve."""
+    assert validate_path(f'{tmp_path}/"') == tmp_path.resolve()
+    assert validate_path(str(tmp_path / "missing")) is None
+
+
+@pytest.mark.unit
+def test_validate_path_not_required_to_exist(tmp_path):
+    """Test that non-existent paths are returned unresolved when must_exist is False."""
+    missing = tmp_path / "new" / "output"
+
+    assert validate_path(f"{missing}\\'", must_exist=False) == missing
+
+
+@pytest.mark.unit
+def test_clean_filename_removes_invalid_characters():
+    """Test that only word characters, dashes, dots, parentheses and spaces survive."""
+    assert clean_filename(' Book: Part/One (2020). ') == 'Book PartOne (2020).'
+    assert clean_filename('') == ''
@@ -0,0 +1,256 @@
+"""
+Tests for metadata cleaning helpers in src.utils.metadata_cleaning.
+"""
+
+import pytest
+from pathlib import Path
+from unittest.mock import patch
+from src.utils.metadata_cleaning import (
+    is_garbage_data, is_duplicate_fields, clean_metadata_text, clean_folder_name,
+    clean_id3_field, extract_metadata_from_sources, generate_search_alternatives,
+    _normalize_for_comparison, _is_redundant_search
+)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("text,expected", [
+    ("exsite.pl", True),
+    ("audiobook.com", True),
+    ("http://example", True),
+    ("www.books", True),
+    ("Storytel Original", True),
+    ("EXSITE.PL", True),
+    ("Ripley's Game", False),
+    ("Przygody ripą", False),
+    ("ſtorytel", True),
+    (".RİP-wc", True),
+    ("Harry Potter", False),
+    ("Gorejące ognie", False),
+    ("Tripwire", False),
+    ("Martha Wells", False),
+    ("www.example.com", True),
+    ("https://test.pl", True),
+    ("", True),
+    ("ab", True),
+    ("  ", True),
+    ("--- ___", True),
+    ("...!?", True),
+    (None, True),
+])
+def test_is_garbage_data(text, expected):
+    """Test detection of domains, URLs, team markers and punctuation-only text."""
+    assert is_garbage_data(text) is expected
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("use_ahocorasick", [True, False])
+def test_garbage_token_prescreen_with_either_backend(monkeypatch, use_ahocorasick):
+    """Test that the token prescreen agrees with the regex with and without pyahocorasick."""
+    import src.utils.metadata_cleaning as cleaning
+    if use_ahocorasick and not cleaning.HAS_AHOCORASICK:
+        pytest.skip("pyahocorasick not installed")
+    monkeypatch.setattr(cleaning, "HAS_AHOCORASICK", use_ahocorasick)
+
+    assert cleaning._contains_garbage_token("exsite.pl")
+    assert cleaning._contains_garbage_token("ripley's game")
+    assert not cleaning._contains_garbage_token("harry potter")
+    assert cleaning.is_garbage_data("Legimi audiobook") is True
+    assert cleaning.is_garbage_data("Ripley's Game") is False
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("title,author,expected", [
+    ("exsite.pl", "exsite.pl", True),
+    ("exsite.pl", " EXSITE.pl ", True),
+    ("Title", "TITLE", True),
+    ("Book Title", "Author Name", False),
+    ("", "Author Name", False),
+    (None, "Author", False),
+])
+def test_is_duplicate_fields(title, author, expected):
+    """Test that title/author duplicates compare case- and whitespace-insensitively."""
+    assert is_duplicate_fields(title, author) is expected
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("text,expected", [
+    ("[AudioBook] Title - Subtitle (2023)", "Title Subtitle"),
+    ("Author: John Doe - Writer", "Author John Doe Writer"),
+    ("Author Name - Book Title (Series #1) [2023]", "Author Name Book Title"),
+    ("{x} a__b--c  :d", "a b c d"),
+    ("Title\t\n  Two", "Title Two"),
+    ("Title\u00a0\u2003Two ", "Title Two"),
+    ("[Lektor] Title {v2} (2019) [MP3]", "Title"),
+    ("Title [x] middle (y) end", "Title middle end"),
+    ("", ""),
+])
+def test_clean_metadata_text(text, expected):
+    """Test bracket removal, separator replacement and whitespace collapsing."""
+    assert clean_metadata_text(text) == expected
+
+
+@pytest.mark.unit
+def test_clean_metadata_text_options_disabled():
+    """Test that brackets and separators survive when their cleaning is turned off."""
+    text = "[Tag] Title - Sub"
+
+    assert clean_metadata_text(text, remove_brackets=False, remove_special_chars=False) == text
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("folder_name,expected", [
+    ("[AudioBook] Frankiewicz Janusz - Gorejące ognie", "Frankiewicz Janusz Gorejące ognie"),
+    ("Martha Wells - Wszystkie wskaźniki czerwone", "Martha Wells Wszystkie wskaźniki czerwone"),
+    ("Author - Title (Series #1) [2023]", "Author Title"),
+])
+def test_clean_folder_name(folder_name, expected):
+    """Test that folder names lose tags and separators but keep non-ASCII letters."""
+    assert clean_folder_name(folder_name) == expected
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("value,expected", [
+    ("exsite.pl", ""),
+    ("Author Name", "Author Name"),
+    ("  -- Harry Potter - Book 1 !! ", "Harry Potter - Book 1"),
+    ("Title   with   gaps", "Title with gaps"),
+    ("…Gorejące ognie —", "Gorejące ognie"),
+    ("_Tytuł_", "Tytuł"),
+    ("1. I", ""),
+    ("2. A", ""),
+    ("3. The", "3. The"),
+    ("1. Title", "1. Title"),
+    ("  Spaced Title  ", "Spaced Title"),
+    ("audiobook.com", ""),
+    ("I", ""),
+    ("12", ""),
+    ("", ""),
+])
+def test_clean_id3_field(value, expected):
+    """Test that ID3 values lose edge punctuation and garbage or too-short values are dropped."""
+    assert clean_id3_field(value) == expected
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("text,expected", [
+    ("Moje śliczne by Karin Slaughter", "moje sliczne karin slaughter"),
+    ("Slaughter Karin - Moje sliczne czyta Filip Kosior", "slaughter karin moje sliczne filip kosior"),
+    ("Book (Audiobook) MP3 128kbps", "book 128kbps"),
+    ("Bypass Reads-Narrated", "bypass"),
+    ("", ""),
+])
+def test_normalize_for_comparison(text, expected):
+    """Test accent folding, whole-word filler removal and punctuation stripping."""
+    assert _normalize_for_comparison(text) == expected
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("term1,term2,expected", [
+    ("Karin Slaughter", "Slaughter Karin - Moje sliczne czyta Filip Kosior", True),
+    ("Moje sliczne by Karin Slaughter", "Slaughter Karin - Moje sliczne czyta Filip Kosior", True),
+    ("Title by Author", "Author - Title", True),
+    ("Book Title", "Different Author", False),
+    ("by czyta", "Book Title", False),
+    ("", "Book Title", False),
+])
+def test_is_redundant_search(term1, term2, expected):
+    """Test that a term whose words are mostly contained in the other is redundant."""
+    assert _is_redundant_search(term1, term2) is expected
+    assert _is_redundant_search(term2, term1) is expected
+
+
+@pytest.mark.unit
+def test_extract_metadata_detects_garbage_id3():
+    """Test that garbage ID3 tags are flagged while the folder name stays usable."""
+    metadata = extract_metadata_from_sources(
+        Path("Frankiewicz Janusz - Gorejące ognie"),
+        id3_title="exsite.pl",
+        id3_author="exsite.pl"
+    )
+
+    assert metadata['folder'] == {
+        'raw': 'Frankiewicz Janusz - Gorejące ognie',
+        'cleaned': 'Frankiewicz Janusz Gorejące ognie',
+        'valid': True
+    }
+    assert metadata['id3']['valid'] is False
+    assert metadata['id3']['garbage_detected'] is True
+
+
+@pytest.mark.unit
+def test_extract_metadata_cleans_repeated_folder_once():
+    """Test that repeated extractions for one folder reuse the cleaned name and fresh dicts."""
+    import src.utils.metadata_cleaning as cleaning
+    cleaning._clean_folder_name_cached.cache_clear()
+    folder = Path("Slaughter Karin - Moje sliczne czyta Filip Kosior 224kbps")
+
+    first = extract_metadata_from_sources(folder, id3_title="1. I", id3_author="Karin Slaughter")
+    first['folder']['cleaned'] = "mutated"
+    second = extract_metadata_from_sources(folder, id3_title="Moje śliczne", id3_author="Karin Slaughter")
+
+    assert second['folder']['cleaned'] == "Slaughter Karin Moje sliczne czyta Filip Kosior 224kbps"
+    assert cleaning._clean_folder_name_cached.cache_info().hits == 1
+
+
+@pytest.mark.unit
+def test_extract_metadata_checks_each_id3_field_once():
+    """Test that title and author are garbage-checked once each, not again after cleaning."""
+    import src.utils.metadata_cleaning as cleaning
+
+    with patch.object(cleaning, 'is_garbage_data', wraps=cleaning.is_garbage_data) as spy:
+        metadata = extract_metadata_from_sources(
+            Path("Folder"), id3_title="  Moje sliczne ", id3_author="exsite.pl"
+        )
+
+    assert spy.call_count == 2
+    assert metadata['id3']['title'] == "Moje sliczne"
+    assert metadata['id3']['author'] == ""
+    assert metadata['id3']['garbage_detected'] is True
+
+
+@pytest.mark.unit
+def test_generate_search_alternatives_skips_redundant_folder():
+    """Test that the folder term is dropped when the ID3 term already covers it."""
+    metadata = extract_metadata_from_sources(
+        Path("Slaughter Karin - Moje sliczne czyta Filip Kosior"),
+        id3_title="Moje sliczne",
+        id3_author="Karin Slaughter"
+    )
+
+    alternatives = generate_search_alternatives(metadata)
+
+    assert [alt.source for alt in alternatives] == ['id3']
+    assert alternatives[0].term == "Moje sliczne by Karin Slaughter"
+
+
+@pytest.mark.unit
+def test_generate_search_alternatives_folder_only():
+    """Test that the folder becomes priority 1 when ID3 tags are unusable."""
+    metadata = extract_metadata_from_sources(
+        Path("Frankiewicz Janusz - Gorejące ognie"),
+        id3_title="exsite.pl",
+        id3_author="exsite.pl"
+    )
+
+    alternatives = generate_search_alternatives(metadata)
+
+    assert [(alt.source, alt.priority) for alt in alternatives] == [('folder', 1)]
+    assert alternatives[0].to_dict() == {
+        'source': 'folder',
+        'term': 'Frankiewicz Janusz Gorejące ognie',
+        'priority': 1,
+        'details': 'Folder: Frankiewicz Janusz - Gorejące ognie'
+    }
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("id3_title,id3_author,expected_sources", [
+    ("1. I", "Karin Slaughter", ['folder']),
+    ("Completely Different Book", "Different Author", ['id3', 'folder']),
+])
+def test_generate_search_alternatives_sources(id3_title, id3_author, expected_sources):
+    """Test that unusable ID3 titles fall back to the folder and unrelated sources are both kept."""
+    folder = "Slaughter Karin - Moje sliczne czyta Filip Kosior 224kbps"
+    metadata = extract_metadata_from_sources(Path(folder), id3_title=id3_title, id3_author=id3_author)
+
+    assert [alt.source for alt in generate_search_alternatives(metadata)] == expected_sources
@@ -0,0 +1,37 @@
+"""
+Tests for console output formatting in src.ui.output.
+"""
+
+import pytest
+from src.ui.output import OutputFormatter
+
+
+@pytest.mark.unit
+def test_format_book_context_with_book_info():
+    """Test that known metadata is listed and emojis are replaced for Windows terminals."""
+    text = OutputFormatter.format_book_context(
+        "📚 MANUAL SEARCH FOR:",
+        "ignored term",
+        {'title': 'Gorejące ognie', 'author': 'Janusz Frankiewicz',
+         'series': 'Saga', 'volume': '2', 'folder_name': 'Frankiewicz - Gorejące ognie'}
+    )
+
+    assert text.splitlines() == [
+        "",
+        "=" * 80,
+        "[Books] MANUAL SEARCH FOR:",
+        "=" * 80,
+        "[Book] Title: Gorejące ognie",
+        "[Author]  Author: Janusz Frankiewicz",
+        "[Books] Series: Saga (Volume 2)",
+        "[Folder] Folder: Frankiewicz - Gorejące ognie",
+        "=" * 80,
+    ]
+
+
+@pytest.mark.unit
+def test_format_book_context_falls_back_to_search_term():
+    """Test that the search term is shown when no book info is available."""
+    text = OutputFormatter.format_book_context("📚 SELECTING METADATA FOR:", "Dune Herbert")
+
+    assert "[Search] Search term: Dune Herbert" in text.splitlines()
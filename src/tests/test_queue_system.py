@@ -5,6 +5,7 @@ This module tests the two-phase task creation system, parallel processing,
 resume functionality, and database operations.
 """
 
+import threading
 import pytest
 import sqlite3
 from pathlib import Path
@@ -570,3 +571,137 @@ def test_queue_manager_api(test_database):
     incomplete = qm.get_incomplete_jobs()
     assert len(incomplete) == 1, "Should have 1 incomplete job"
     assert incomplete[0]['id'] == job_id, "Incomplete job should be our job"
+
+
+@pytest.mark.unit
+def test_queue_manager_enables_wal(test_database):
+    """Test that the queue database uses WAL with relaxed synchronous commits."""
+    qm = QueueManager()
+    try:
+        cursor = qm.connection.cursor()
+        assert cursor.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+        assert cursor.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+    finally:
+        qm.close()
+
+
+@pytest.mark.unit
+def test_queue_manager_transaction_commits_once(test_database):
+    """Test that writes inside transaction() are committed together or rolled back together."""
+    qm = QueueManager()
+    observer = sqlite3.connect(str(test_database))
+    try:
+        job_id = qm.create_job(ProcessingArgs(folders=[Path('/tmp/test')]))
+
+        with qm.transaction():
+            qm.create_task(job_id, Path('/tmp/test/book1'), url=None)
+            qm.create_task(job_id, Path('/tmp/test/book2'), url=None)
+            # Not visible to other connections until the block commits
+            assert observer.execute("SELECT COUNT(*) FROM tasks").fetchone()[0] == 0
+        assert observer.execute("SELECT COUNT(*) FROM tasks").fetchone()[0] == 2
+
+        with pytest.raises(RuntimeError):
+            with qm.transaction():
+                qm.create_task(job_id, Path('/tmp/test/book3'), url=None)
+                raise RuntimeError("abort")
+        assert observer.execute("SELECT COUNT(*) FROM tasks").fetchone()[0] == 2
+    finally:
+        observer.close()
+        qm.close()
+
+
+@pytest.mark.unit
+def test_queue_manager_nested_transaction_rolls_back_inner_block(test_database):
+    """Test that a failed inner block is undone even when the outer block catches the error."""
+    qm = QueueManager()
+    try:
+        job_id = qm.create_job(ProcessingArgs(folders=[Path('/tmp/test')]))
+
+        with qm.transaction():
+            kept_id = qm.create_task(job_id, Path('/tmp/test/book1'), url=None)
+            try:
+                with qm.transaction():
+                    qm.create_task(job_id, Path('/tmp/test/book2'), url=None)
+                    raise RuntimeError("abort inner")
+            except RuntimeError:
+                pass
+
+        tasks = qm.get_tasks_for_job(job_id)
+        assert [task['id'] for task in tasks] == [kept_id]
+    finally:
+        qm.close()
+
+
+@pytest.mark.unit
+def test_queue_manager_transaction_blocks_other_threads(test_database):
+    """Test that another thread's write waits for an open block instead of joining it."""
+    qm = QueueManager()
+    try:
+        job_id = qm.create_job(ProcessingArgs(folders=[Path('/tmp/test')]))
+        writer_done = threading.Event()
+
+        def write_from_other_thread():
+            qm.create_task(job_id, Path('/tmp/test/other'), url=None)
+            writer_done.set()
+
+        with pytest.raises(RuntimeError):
+            with qm.transaction():
+                qm.create_task(job_id, Path('/tmp/test/book1'), url=None)
+                writer = threading.Thread(target=write_from_other_thread)
+                writer.start()
+                assert not writer_done.wait(0.2)
+                raise RuntimeError("abort")
+
+        writer.join(timeout=5)
+        assert writer_done.is_set()
+        tasks = qm.get_tasks_for_job(job_id)
+        assert [task['folder_path'] for task in tasks] == [str(Path('/tmp/test/other'))]
+    finally:
+        qm.close()
+
+
+@pytest.mark.unit
+def test_create_tasks_batch_insert(test_database):
+    """Test that create_tasks inserts all folders in order and returns their IDs."""
+    qm = QueueManager()
+    try:
+        job_id = qm.create_job(ProcessingArgs(folders=[Path('/tmp/test')]))
+
+        task_ids = qm.create_tasks(job_id, [
+            (Path('/tmp/test/book1'), None),
+            (Path('/tmp/test/book2'), 'OPF'),
+        ])
+
+        assert len(set(task_ids)) == 2
+        assert qm.get_task(task_ids[0])['folder_path'] == str(Path('/tmp/test/book1'))
+        assert qm.get_task(task_ids[1])['url'] == 'OPF'
+        assert qm.get_job_progress(job_id)['pending'] == 2
+        assert qm.create_tasks(job_id, []) == []
+    finally:
+        qm.close()
+
+
+@pytest.mark.unit
+def test_wait_for_task_update_wakes_on_status_change(test_database):
+    """Test that a status change from a worker thread wakes a waiting monitor immediately."""
+    qm = QueueManager()
+    try:
+        job_id = qm.create_job(ProcessingArgs(folders=[Path('/tmp/test')]))
+        task_id = qm.create_task(job_id, Path('/tmp/test/book1'), None)
+        QueueManager.wait_for_task_update(0)  # Drop signals from earlier updates
+
+        def worker():
+            worker_qm = QueueManager()
+            try:
+                worker_qm.update_task_status(task_id, 'running')
+            finally:
+                worker_qm.close()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+
+        assert QueueManager.wait_for_task_update(5.0) is True
+        thread.join()
+        assert QueueManager.wait_for_task_update(0.01) is False
+    finally:
+        qm.close()
@@ -9,7 +9,7 @@ from pathlib import Path
 from typing import List, Dict, Any
 
 from ..models import BookMetadata, ProcessingResult
-from ..utils import safe_encode_text
+from ..utils import safe_encode_text, format_duration, format_file_size
 
 
 class OutputFormatter:
@@ -208,6 +208,53 @@ class OutputFormatter:
         
         return "\n".join(lines)
     
+    @staticmethod
+    def format_book_context(heading: str, search_term: str, book_info: dict = None) -> str:
+        """
+        Format the context block shown before selecting metadata for a book.
+        
+        Args:
+            heading: Banner line, e.g. "📚 MANUAL SEARCH FOR:"
+            search_term: Search term, shown when no book info is available
+            book_info: Known metadata (title, author, series, ...) for the book
+            
+        Returns:
+            Formatted context block, safe for Windows terminals
+        """
+        lines = ["\n" + "=" * 80, heading, "=" * 80]
+        
+        if book_info:
+            # Display available metadata
+            if book_info.get('title'):
+                lines.append(f"📖 Title: {book_info['title']}")
+            if book_info.get('author'):
+                lines.append(f"✍️  Author: {book_info['author']}")
+            if book_info.get('series'):
+                series_info = book_info['series']
+                if book_info.get('volume'):
+                    series_info += f" (Volume {book_info['volume']})"
+                lines.append(f"📚 Series: {series_info}")
+            if book_info.get('narrator'):
+                lines.append(f"🎤 Narrator: {book_info['narrator']}")
+            if book_info.get('publisher'):
+                lines.append(f"🏢 Publisher: {book_info['publisher']}")
+            if book_info.get('year'):
+                lines.append(f"📅 Year: {book_info['year']}")
+            if book_info.get('language'):
+                lines.append(f"🌍 Language: {book_info['language']}")
+            if book_info.get('source'):
+                lines.append(f"📂 Source: {book_info['source']}")
+            
+            # Show folder name if different from title
+            if book_info.get('folder_name') and book_info.get('folder_name') != book_info.get('title'):
+                lines.append(f"📁 Folder: {book_info['folder_name']}")
+        else:
+            # Fallback to search term
+            lines.append(f"🔍 Search term: {search_term}")
+        
+        lines.append("=" * 80)
+        return safe_encode_text("\n".join(lines))
+    
     @staticmethod
     def format_file_list(files: List[Path], title: str = "Files") -> str:
         """
@@ -283,16 +330,7 @@ class OutputFormatter:
         Returns:
             Formatted time string
         """
-        if seconds < 60:
-            return f"{seconds:.1f}s"
-        elif seconds < 3600:
-            minutes = int(seconds // 60)
-            secs = int(seconds % 60)
-            return f"{minutes}m {secs}s"
-        else:
-            hours = int(seconds // 3600)
-            minutes = int((seconds % 3600) // 60)
-            return f"{hours}h {minutes}m"
+        return format_duration(seconds)
     
     @staticmethod
     def format_size(bytes_size: int) -> str:
@@ -305,18 +343,7 @@ class OutputFormatter:
         Returns:
             Formatted size string
         """
-        if bytes_size == 0:
-            return "0 B"
-        
-        size_names = ["B", "KB", "MB", "GB", "TB"]
-        size_index = 0
-        size = float(bytes_size)
-        
-        while size >= 1024 and size_index < len(size_names) - 1:
-            size /= 1024
-            size_index += 1
-        
-        return f"{size:.1f} {size_names[size_index]}"
+        return format_file_size(bytes_size)
     
     @staticmethod
     def format_table(data: List[Dict[str, Any]], headers: List[str]) -> str:
@@ -9,7 +9,7 @@ from typing import List, Optional
 from pathlib import Path
 
 from ..models import BookMetadata, ProcessingResult
-from ..utils import ProgressTracker
+from ..utils import ProgressTracker, format_duration
 
 
 class ProgressReporter:
@@ -176,16 +176,7 @@ class ProgressReporter:
         Returns:
             Formatted time string
         """
-        if seconds < 60:
-            return f"{seconds:.1f}s"
-        elif seconds < 3600:
-            minutes = int(seconds // 60)
-            secs = int(seconds % 60)
-            return f"{minutes}m {secs}s"
-        else:
-            hours = int(seconds // 3600)
-            minutes = int((seconds % 3600) // 60)
-            return f"{hours}h {minutes}m"
+        return format_duration(seconds)
     
     def show_final_summary(self, result: ProcessingResult):
         """
@@ -311,8 +302,9 @@ class VerboseProgressReporter(ProgressReporter):
                 print(f"  Estimated time remaining: {self.format_time(remaining)}")
             
             # Show folder size
-            from ..utils import get_folder_size, format_file_size
+            from ..utils import scan_folder, format_file_size
             folder_path = Path(metadata.input_folder)
             if folder_path.exists():
-                size = get_folder_size(folder_path)
-                print(f"  Folder size: {format_file_size(size)}")
+                scan = scan_folder(folder_path)
+                print(f"  Folder size: {format_file_size(scan.total_size)}")
+                print(f"  Audio files: {len(scan.audio_files)}")
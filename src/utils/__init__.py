@@ -21,7 +21,10 @@ from .helpers import (
     calculate_padding_for_tracks,
     sanitize_xml_text,
     format_file_size,
+    format_duration,
     get_folder_size,
+    scan_folder,
+    FolderScan,
     normalize_series_volume,
     safe_encode_text,
     ProgressTracker
@@ -50,7 +53,10 @@ __all__ = [
     'calculate_padding_for_tracks',
     'sanitize_xml_text',
     'format_file_size',
+    'format_duration',
     'get_folder_size',
+    'scan_folder',
+    'FolderScan',
     'normalize_series_volume',
     'safe_encode_text',
     'ProgressTracker',
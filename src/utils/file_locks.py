@@ -6,6 +6,9 @@ Fallback to database-based locks if file locking unavailable.
 """
 
 import time
+import random
+import sqlite3
+import threading
 import logging as log
 from pathlib import Path
 from typing import Optional
@@ -23,6 +26,15 @@ except ImportError:
 class FileLockManager:
     """Manages file system locks for directory creation."""
 
+    # In-process wakeup for DB locks, shared by all managers in this process
+    # (each worker thread creates its own manager). A fixed pool picked by
+    # path hash keeps memory bounded; paths sharing a condition only cost
+    # an extra wakeup and retry.
+    _conditions = tuple(threading.Condition() for _ in range(64))
+
+    # Initial back-off between attempts when the holder is in another process
+    _min_backoff = 0.005
+
     def __init__(self, db_connection=None):
         """
         Initialize lock manager.
@@ -43,7 +55,9 @@ class FileLockManager:
             directory_path: Path to lock (author or series directory)
             task_id: Task ID requesting lock
             timeout: Maximum seconds to wait for lock
-            poll_interval: Seconds between lock attempts
+            poll_interval: Maximum seconds between lock attempts (DB locks
+                           back off up to this value, waking immediately when
+                           a holder in the same process releases)
 
         Yields:
             True when lock acquired
@@ -80,28 +94,60 @@ class FileLockManager:
                 except:
                     pass
 
+    @classmethod
+    def _get_condition(cls, normalized_path: str) -> threading.Condition:
+        """Get the wakeup condition for a lock path."""
+        return cls._conditions[hash(normalized_path) % len(cls._conditions)]
+
+    def _try_insert_lock(self, normalized_path: str, task_id: str) -> bool:
+        """
+        Attempt a single lock acquisition.
+
+        Takes the write lock up-front with BEGIN IMMEDIATE so a held lock
+        fails fast on the lock_path PRIMARY KEY instead of upgrading a
+        deferred transaction.
+
+        Returns:
+            True if the lock row was inserted, False if the lock is held
+        """
+        cursor = self.db_connection.cursor()
+        started_transaction = not self.db_connection.in_transaction
+        try:
+            if started_transaction:
+                cursor.execute("BEGIN IMMEDIATE")
+            cursor.execute(
+                "INSERT INTO file_locks (lock_path, locked_by_task) VALUES (?, ?)",
+                (normalized_path, task_id)
+            )
+            self.db_connection.commit()
+            return True
+        except (sqlite3.IntegrityError, sqlite3.OperationalError) as e:
+            # IntegrityError: lock already held; OperationalError: database busy
+            if started_transaction and self.db_connection.in_transaction:
+                self.db_connection.rollback()
+            log.debug(f"DB lock busy: {normalized_path} ({e})")
+            return False
+
     def _db_lock(self, directory_path: Path, task_id: str,
                  timeout: float, poll_interval: float):
         """Database-based lock for cross-process coordination."""
         normalized_path = str(directory_path.resolve())
-        start_time = time.time()
-
-        while True:
-            try:
-                # Attempt to acquire lock
-                cursor = self.db_connection.cursor()
-                cursor.execute(
-                    "INSERT INTO file_locks (lock_path, locked_by_task) VALUES (?, ?)",
-                    (normalized_path, task_id)
-                )
-                self.db_connection.commit()
-                log.debug(f"Acquired DB lock: {normalized_path} for task {task_id}")
-                break
-            except Exception as e:
-                # Lock already held
-                if time.time() - start_time > timeout:
-                    raise TimeoutError(f"Could not acquire lock for {normalized_path} within {timeout}s")
-                time.sleep(poll_interval)
+        condition = self._get_condition(normalized_path)
+        deadline = time.monotonic() + timeout
+        backoff = min(self._min_backoff, poll_interval)
+
+        while not self._try_insert_lock(normalized_path, task_id):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"Could not acquire lock for {normalized_path} within {timeout}s")
+
+            # Holders in this process notify on release; the bounded, jittered
+            # wait covers holders in other processes
+            with condition:
+                condition.wait(timeout=min(remaining, backoff * random.uniform(1.0, 1.5)))
+            backoff = min(backoff * 2, poll_interval)
+
+        log.debug(f"Acquired DB lock: {normalized_path} for task {task_id}")
 
         try:
             yield True
@@ -114,3 +160,6 @@ class FileLockManager:
             )
             self.db_connection.commit()
             log.debug(f"Released DB lock: {normalized_path}")
+
+            with condition:
+                condition.notify_all()
@@ -6,13 +6,73 @@ to canonical designators based on a mapping file. Includes optional LLM-based
 categorization for unmapped genres.
 """
 
+import atexit
+import functools
 import json
+import os
+import sys
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Dict, Set, Optional
+from typing import List, Dict, Set, Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Use orjson for mapping load/save when available (optional speedup)
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Use ijson to stream-parse very large mapping files when available (optional)
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+
+def _json_loads(data: bytes):
+    """Parse UTF-8 JSON bytes."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj, sort_keys: bool = False) -> bytes:
+    """Serialize to 2-space indented UTF-8 JSON bytes (non-ASCII kept as is)."""
+    if HAS_ORJSON:
+        option = orjson.OPT_INDENT_2 | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2, ensure_ascii=False, sort_keys=sort_keys).encode('utf-8')
+
+
+def _write_json_atomic(path: Path, obj):
+    """
+    Write obj as sorted JSON to path without exposing a partially written file.
+
+    Writes a temporary file next to path and renames it over path.
+    """
+    tmp_file = path.with_suffix(path.suffix + '.tmp')
+    with open(tmp_file, 'wb') as f:
+        f.write(_json_dumps(obj, sort_keys=True))
+    os.replace(tmp_file, path)
+
+
+# Punctuation variants ("sci-fi", "science fiction & fantasy", "y.a.") fold to one key
+_GENRE_KEY_TRANSLATION = str.maketrans({'-': ' ', '_': ' ', '&': ' ', '/': ' ', '.': ''})
+
+
+def _canonicalize_key(genre: str) -> str:
+    """Fold punctuation and whitespace variants of a lowercase genre name to one key."""
+    return ' '.join(genre.translate(_GENRE_KEY_TRANSLATION).split())
+
+
+class LLMUnavailableError(Exception):
+    """Raised when the LLM cannot be reached on its first categorization request."""
+
 
 class GenreNormalizer:
     """Handles genre normalization and mapping to canonical forms."""
@@ -23,6 +83,18 @@ class GenreNormalizer:
     # Maximum tokens for LLM response (allows for reasoning in response)
     LLM_MAX_TOKENS = 6000
 
+    # Maximum number of raw genre strings remembered by the lookup cache
+    CANONICAL_CACHE_SIZE = 4096
+
+    # Maximum number of whole genre lists remembered by normalize_genres
+    LIST_CACHE_SIZE = 4096
+
+    # Mapping files larger than this are stream-parsed with ijson (if installed)
+    STREAMING_LOAD_THRESHOLD = 4 * 1024 * 1024
+
+    # Side file (next to the mapping file) remembering LLM decisions across runs
+    LLM_CACHE_FILENAME = ".genre_llm_cache.json"
+
     def __init__(self, mapping_file: Path = None, use_llm: bool = False):
         """
         Initialize the genre normalizer.
@@ -38,12 +110,54 @@ class GenreNormalizer:
             mapping_file = project_root / "genre_mapping.json"
 
         self.mapping_file = Path(mapping_file)
-        self.mapping = self._load_mapping()
+        self._mapping: Optional[Dict[str, List[str]]] = None
+        self._alt_index: Dict[str, str] = {}
+        self._norm_alt_index: Dict[str, str] = {}
+        self._alt_sets: Dict[str, Set[str]] = {}
+        self._canon_cache: Dict[str, str] = {}
+        self._list_cache: "OrderedDict[Tuple[str, ...], List[str]]" = OrderedDict()
+        self._mapping_version = 0
+        self._mapping_json_cache: Optional[str] = None
+        self._dirty = False
+        self._cache_lock = threading.Lock()
+        # Guards the mapping, derived indexes and files against concurrent mutation
+        self._mut_lock = threading.RLock()
         self.use_llm = use_llm
-        self.llm_available = False
-
-        if self.use_llm:
-            self._test_llm_connection()
+        self._llm_available: Optional[bool] = None
+        self._llm_connected = False
+        self._llm_cache_file = self.mapping_file.with_name(self.LLM_CACHE_FILENAME)
+        self._llm_cache: Optional[Dict[str, str]] = None
+        self._llm_cache_dirty = False
+
+    @property
+    def mapping(self) -> Dict[str, List[str]]:
+        """Genre mapping, loaded from the mapping file on first access."""
+        if self._mapping is None:
+            with self._mut_lock:
+                if self._mapping is None:
+                    mapping = self._load_mapping()
+                    self._rebuild_alt_index(mapping)
+                    # Publish last: unlocked readers that see a mapping must
+                    # also see its finished indexes
+                    self._mapping = mapping
+        return self._mapping
+
+    @mapping.setter
+    def mapping(self, value: Dict[str, List[str]]):
+        with self._mut_lock:
+            self._rebuild_alt_index(value)
+            self._mapping = value
+
+    @property
+    def llm_available(self) -> bool:
+        """Whether LLM categorization is usable; configuration is checked on first access."""
+        if self._llm_available is None:
+            self._llm_available = self.use_llm and self._check_llm_config()
+        return self._llm_available
+
+    @llm_available.setter
+    def llm_available(self, value: bool):
+        self._llm_available = value
 
     def _load_mapping(self) -> Dict[str, List[str]]:
         """
@@ -65,14 +179,131 @@ class GenreNormalizer:
             return {}
 
         try:
-            with open(self.mapping_file, 'r', encoding='utf-8') as f:
-                mapping = json.load(f)
-                # Ensure all keys and values are lowercase
-                return {k.lower(): [alt.lower() for alt in v] for k, v in mapping.items()}
+            with open(self.mapping_file, 'rb') as f:
+                if HAS_IJSON and os.fstat(f.fileno()).st_size > self.STREAMING_LOAD_THRESHOLD:
+                    # Build the lowercased dict straight from the stream instead
+                    # of holding the parsed file and its lowercased copy at once
+                    items = ijson.kvitems(f, '')
+                else:
+                    items = _json_loads(f.read()).items()
+
+                # Ensure all keys and values are lowercase; intern them so lookups and
+                # dedup of the (few, often repeated) genre names compare by identity
+                return {
+                    sys.intern(k.lower()): [sys.intern(alt.lower()) for alt in v]
+                    for k, v in items
+                }
         except Exception as e:
             logger.error(f"Error loading genre mapping: {e}")
             return {}
 
+    def _rebuild_alt_index(self, mapping: Dict[str, List[str]]):
+        """
+        Rebuild the lookup structures derived from a mapping.
+
+        The reverse index maps every known genre name to its canonical form.
+        Canonical names map to themselves and take precedence over alternatives;
+        an alternative listed under several canonicals maps to the first one.
+        A second index keyed on punctuation-folded names (see _canonicalize_key)
+        catches unlisted variants such as "sci fi" for "sci-fi".
+        Alternative sets mirror the list-form mapping (kept for JSON round-trip)
+        for constant-time membership checks.
+
+        Args:
+            mapping: Mapping the indexes are built from (built before it is
+                     published as self._mapping).
+        """
+        index = {canonical: canonical for canonical in mapping}
+        norm_index = {_canonicalize_key(canonical): canonical for canonical in mapping}
+        for canonical, alternatives in mapping.items():
+            for alt in alternatives:
+                index.setdefault(alt, canonical)
+                norm_index.setdefault(_canonicalize_key(alt), canonical)
+        self._alt_index = index
+        self._norm_alt_index = norm_index
+        self._alt_sets = {canonical: set(alts) for canonical, alts in mapping.items()}
+        self._clear_caches()
+
+    def _clear_caches(self):
+        """Drop memoized lookups after the mapping changed."""
+        with self._cache_lock:
+            self._canon_cache.clear()
+            self._list_cache.clear()
+            self._mapping_json_cache = None
+            self._mapping_version += 1
+
+    def _remember_canonical(self, genre: str, canonical: str):
+        """Memoize the canonical form for a raw genre string."""
+        with self._cache_lock:
+            if len(self._canon_cache) >= self.CANONICAL_CACHE_SIZE:
+                self._canon_cache.clear()
+            self._canon_cache[genre] = canonical
+
+    def _get_llm_cache(self) -> Dict[str, str]:
+        """
+        Get the persistent LLM decision cache, loading it from disk on first use.
+
+        Returns:
+            Dictionary mapping "model::genre" to a canonical genre name or "NO_FIT".
+        """
+        if self._llm_cache is None:
+            with self._mut_lock:
+                if self._llm_cache is None:
+                    cache = {}
+                    if self._llm_cache_file.exists():
+                        try:
+                            with open(self._llm_cache_file, 'rb') as f:
+                                loaded = _json_loads(f.read())
+                            if isinstance(loaded, dict):
+                                cache = loaded
+                        except Exception as e:
+                            logger.warning(f"Error loading LLM genre cache: {e}")
+                    self._llm_cache = cache
+        return self._llm_cache
+
+    def _lookup_llm_decision(self, model: str, genre: str) -> Optional[str]:
+        """
+        Look up a previous LLM decision for a genre.
+
+        Args:
+            model: LLM model name (decisions are kept per model).
+            genre: Normalized genre name.
+
+        Returns:
+            "NO_FIT", a canonical genre still present in the mapping, or None if
+            there is no usable cached decision.
+        """
+        answer = self._get_llm_cache().get(f"{model}::{genre}")
+        if answer == "NO_FIT" or answer in self.mapping:
+            return answer
+        return None
+
+    def _store_llm_decisions(self, model: str, decisions: Dict[str, Optional[str]]):
+        """
+        Remember LLM decisions; flush_mapping() writes them to the cache file.
+
+        Args:
+            model: LLM model name.
+            decisions: Genre to canonical genre name, or None for NO_FIT.
+        """
+        if not decisions:
+            return
+
+        cache = self._get_llm_cache()
+        with self._mut_lock:
+            for genre, canonical in decisions.items():
+                cache[f"{model}::{genre}"] = canonical or "NO_FIT"
+            self._llm_cache_dirty = True
+
+    def _save_llm_cache(self):
+        """Write the LLM decision cache file atomically."""
+        with self._mut_lock:
+            try:
+                _write_json_atomic(self._llm_cache_file, self._llm_cache)
+                self._llm_cache_dirty = False
+            except Exception as e:
+                logger.error(f"Error saving LLM genre cache: {e}")
+
     def _create_default_mapping(self):
         """Create a default genre mapping file with examples."""
         default_mapping = {
@@ -85,25 +316,26 @@ class GenreNormalizer:
         }
 
         try:
-            with open(self.mapping_file, 'w', encoding='utf-8') as f:
-                json.dump(default_mapping, f, indent=2, ensure_ascii=False)
+            with open(self.mapping_file, 'wb') as f:
+                f.write(_json_dumps(default_mapping))
             logger.info(f"Created default genre mapping file: {self.mapping_file}")
         except Exception as e:
             logger.error(f"Error creating default genre mapping: {e}")
 
-    def _test_llm_connection(self) -> bool:
+    def _check_llm_config(self) -> bool:
         """
-        Test LLM connection during initialization.
+        Check that LLM categorization is configured, without a network round-trip.
+
+        The connection itself is verified by the first categorization request.
 
         Returns:
-            True if LLM is available and working, False otherwise.
+            True if LLM is configured and litellm is installed, False otherwise.
         """
         try:
             from ..config import LLM_CONFIG
 
             if not LLM_CONFIG['enabled']:
                 logger.warning("LLM genre categorization requested but no LLM_API_KEY configured")
-                self.llm_available = False
                 return False
 
             import litellm
@@ -112,34 +344,54 @@ class GenreNormalizer:
             if LLM_CONFIG['base_url']:
                 litellm.api_base = LLM_CONFIG['base_url']
 
-            # Test with a simple prompt
-            logger.info(f"Testing LLM connection for genre categorization (model: {LLM_CONFIG['model']})...")
-            response = litellm.completion(
-                model=LLM_CONFIG['model'],
-                api_key=LLM_CONFIG['api_key'],
-                messages=[{"role": "user", "content": "Reply with only the word 'OK'"}],
-                temperature=0.1,
-                max_tokens=10
-            )
-
-            if response and response.choices:
-                logger.info("LLM connection successful - genre categorization enabled")
-                self.llm_available = True
-                return True
-            else:
-                logger.error("LLM connection failed - genre categorization disabled")
-                self.llm_available = False
-                return False
+            logger.info(f"LLM genre categorization enabled (model: {LLM_CONFIG['model']})")
+            return True
 
         except ImportError:
             logger.error("litellm library not available - genre categorization disabled. Install with: pip install litellm")
-            self.llm_available = False
             return False
         except Exception as e:
-            logger.error(f"Failed to connect to LLM for genre categorization: {e}")
-            self.llm_available = False
+            logger.error(f"Failed to configure LLM for genre categorization: {e}")
             return False
 
+    def _request_llm_completion(self, prompt: str):
+        """
+        Send a categorization prompt to the LLM.
+
+        If the very first request fails, the LLM is treated as unreachable and
+        categorization is disabled for this normalizer.
+
+        Args:
+            prompt: The prompt to send.
+
+        Returns:
+            The litellm completion response.
+
+        Raises:
+            LLMUnavailableError: If the first request fails.
+            Exception: If a later request fails.
+        """
+        import litellm
+        from ..config import LLM_CONFIG
+
+        try:
+            response = litellm.completion(
+                model=LLM_CONFIG['model'],
+                api_key=LLM_CONFIG['api_key'],
+                messages=[{"role": "user", "content": prompt}],
+                temperature=0.2,  # Low temperature for consistent categorization
+                max_tokens=self.LLM_MAX_TOKENS
+            )
+        except Exception as e:
+            if not self._llm_connected:
+                logger.error(f"Failed to connect to LLM for genre categorization - genre categorization disabled: {e}")
+                self.llm_available = False
+                raise LLMUnavailableError(str(e)) from e
+            raise
+
+        self._llm_connected = True
+        return response
+
     def _categorize_genre_with_llm(self, new_genre: str) -> Optional[str]:
         """
         Use LLM to categorize a new genre into an existing category.
@@ -156,21 +408,20 @@ class GenreNormalizer:
             raise Exception("LLM not available")
 
         try:
-            import litellm
             from ..config import LLM_CONFIG
 
+            # Reuse a decision from a previous run
+            cached = self._lookup_llm_decision(LLM_CONFIG['model'], new_genre)
+            if cached is not None:
+                logger.info(f"LLM (cached): Categorized '{new_genre}' as '{cached}'")
+                return None if cached == "NO_FIT" else cached
+
             # Build prompt with current mapping
             prompt = self._build_categorization_prompt(new_genre)
 
             logger.debug(f"Asking LLM to categorize genre: '{new_genre}'")
 
-            response = litellm.completion(
-                model=LLM_CONFIG['model'],
-                api_key=LLM_CONFIG['api_key'],
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.2,  # Low temperature for consistent categorization
-                max_tokens=self.LLM_MAX_TOKENS
-            )
+            response = self._request_llm_completion(prompt)
 
             # Validate finish_reason to ensure complete response
             finish_reason = response.choices[0].finish_reason
@@ -179,6 +430,7 @@ class GenreNormalizer:
 
             response_text = response.choices[0].message.content.strip()
             result = self._parse_llm_categorization(response_text, new_genre)
+            self._store_llm_decisions(LLM_CONFIG['model'], {new_genre: result})
 
             return result
 
@@ -186,6 +438,14 @@ class GenreNormalizer:
             logger.error(f"LLM genre categorization failed for '{new_genre}': {e}")
             raise
 
+    def _get_mapping_json(self) -> str:
+        """Get the mapping rendered as JSON for LLM prompts (cached until the mapping changes)."""
+        mapping_json = self._mapping_json_cache
+        if mapping_json is None:
+            mapping_json = _json_dumps(self.mapping).decode('utf-8')
+            self._mapping_json_cache = mapping_json
+        return mapping_json
+
     def _build_categorization_prompt(self, new_genre: str) -> str:
         """
         Build the LLM prompt for genre categorization.
@@ -196,13 +456,10 @@ class GenreNormalizer:
         Returns:
             The prompt string.
         """
-        # Get list of canonical genres
-        canonical_genres = sorted(self.mapping.keys())
-
         prompt = f"""You are a book genre classification assistant. I need you to determine if a new genre fits into any of my existing genre categories.
 
 Existing genre categories and their alternatives:
-{json.dumps(self.mapping, indent=2, ensure_ascii=False)}
+{self._get_mapping_json()}
 
 New genre to categorize: "{new_genre}"
 
@@ -253,35 +510,262 @@ Respond with ONLY the canonical genre name or "NO_FIT". No explanations, no reas
         # Check if response is a valid canonical genre
         if response_text in self.mapping:
             logger.info(f"LLM: Categorized '{genre}' as '{response_text}'")
-            return response_text
+            return sys.intern(response_text)
 
         # Invalid response - raise exception to skip this genre
         raise Exception(f"LLM returned invalid response: '{response_text}'")
 
-    def _find_canonical_genre(self, genre: str) -> str:
+    def _categorize_genres_with_llm_batch(self, new_genres: List[str]) -> Dict[str, Optional[str]]:
         """
-        Find the canonical form of a genre.
+        Use LLM to categorize several new genres with a single request.
 
         Args:
-            genre: Genre name to normalize (will be lowercased).
+            new_genres: The unmapped genres to categorize (normalized).
+
+        Returns:
+            Dictionary mapping each genre the LLM answered validly to its
+            canonical genre name, or None for NO_FIT. Genres with a missing
+            or invalid answer are left out.
+
+        Raises:
+            Exception: If LLM is unavailable or the response is invalid/incomplete.
+        """
+        if not self.llm_available:
+            raise Exception("LLM not available")
+
+        try:
+            from ..config import LLM_CONFIG
+
+            # Reuse decisions from previous runs, only ask about the rest
+            results: Dict[str, Optional[str]] = {}
+            for genre in new_genres:
+                cached = self._lookup_llm_decision(LLM_CONFIG['model'], genre)
+                if cached is not None:
+                    results[genre] = None if cached == "NO_FIT" else cached
+            new_genres = [genre for genre in new_genres if genre not in results]
+            if not new_genres:
+                return results
+
+            prompt = self._build_batch_categorization_prompt(new_genres)
+
+            logger.debug(f"Asking LLM to categorize {len(new_genres)} genres: {new_genres}")
+
+            response = self._request_llm_completion(prompt)
+
+            # Validate finish_reason to ensure complete response
+            finish_reason = response.choices[0].finish_reason
+            if finish_reason != "stop":
+                raise Exception(f"LLM response incomplete (finish_reason: {finish_reason})")
+
+            response_text = response.choices[0].message.content.strip()
+            decisions = self._parse_llm_batch_categorization(response_text, new_genres)
+            self._store_llm_decisions(LLM_CONFIG['model'], decisions)
+            results.update(decisions)
+
+            return results
+
+        except Exception as e:
+            logger.error(f"LLM batch genre categorization failed for {new_genres}: {e}")
+            raise
+
+    def _build_batch_categorization_prompt(self, new_genres: List[str]) -> str:
+        """
+        Build the LLM prompt for categorizing several genres at once.
+
+        Args:
+            new_genres: The genres to categorize.
+
+        Returns:
+            The prompt string.
+        """
+        threshold = int(self.LLM_CONFIDENCE_THRESHOLD * 100)
+        genres_list = "\n".join(f'- "{genre}"' for genre in new_genres)
+
+        prompt = f"""You are a book genre classification assistant. I need you to determine if new genres fit into any of my existing genre categories.
+
+Existing genre categories and their alternatives:
+{self._get_mapping_json()}
+
+New genres to categorize:
+{genres_list}
+
+Your task, for each new genre:
+1. Determine if it can be reasonably categorized as one of the existing genres listed above
+2. Only suggest a match if you are at least {threshold}% confident it fits
+3. Consider synonyms, related concepts, subcategories, and translations
+4. IMPORTANT: Genres in different languages should match if they mean the same thing
+   - Example: "historia" (Spanish/Polish) = "history"
+   - Example: "fantastyka" (Polish) = "fantasy"
+   - The language difference should NOT reduce your confidence if the meaning matches
+
+Response format:
+A single JSON object with one entry per new genre. Use the genre exactly as given as the key.
+The value is the canonical genre name if you found a match with {threshold}%+ confidence, otherwise "NO_FIT".
+
+Example:
+{{"cyberpunk": "science fiction", "cozy mystery": "mystery", "french literature": "NO_FIT"}}
+
+Respond with ONLY the JSON object. No explanations, no reasoning, no markdown."""
+
+        return prompt
+
+    def _parse_llm_batch_categorization(self, response_text: str,
+                                        genres: List[str]) -> Dict[str, Optional[str]]:
+        """
+        Parse a batch LLM categorization response.
+
+        Args:
+            response_text: Raw LLM response (JSON object, possibly wrapped in markdown).
+            genres: Genres that were sent for categorization.
+
+        Returns:
+            Dictionary of validly answered genres to canonical name or None (NO_FIT).
+
+        Raises:
+            Exception: If the response is not a JSON object.
+        """
+        start = response_text.find('{')
+        end = response_text.rfind('}')
+        if start == -1 or end < start:
+            raise Exception(f"LLM returned invalid response: '{response_text}'")
+
+        data = json.loads(response_text[start:end + 1])
+        if not isinstance(data, dict):
+            raise Exception(f"LLM returned invalid response: '{response_text}'")
+
+        answers = {str(key).strip().lower(): value for key, value in data.items()}
+        results: Dict[str, Optional[str]] = {}
+
+        for genre in genres:
+            answer = answers.get(genre)
+            if not isinstance(answer, str):
+                logger.warning(f"LLM: No answer for genre '{genre}'")
+                continue
+
+            answer = answer.strip().lower()
+            if answer == "no_fit":
+                logger.info(f"LLM: No confident match found for genre '{genre}' (NO_FIT)")
+                results[genre] = None
+            elif answer in self.mapping:
+                logger.info(f"LLM: Categorized '{genre}' as '{answer}'")
+                results[genre] = sys.intern(answer)
+            else:
+                logger.warning(f"LLM returned invalid category for '{genre}': '{answer}'")
+
+        return results
+
+    def _resolve_unmapped_genres(self, unmapped: List[str]) -> Tuple[Dict[str, str], Set[str]]:
+        """
+        Categorize unmapped genres with the LLM, updating and saving the mapping.
+
+        A single genre uses the one-genre prompt; several genres share one request.
+
+        Args:
+            unmapped: Normalized genres not found in the mapping.
+
+        Returns:
+            Tuple of (genre -> canonical genre for resolved genres, set of failed genres).
+        """
+        if len(unmapped) == 1:
+            genre_lower = unmapped[0]
+            try:
+                # Already looked up by the caller - go straight to the LLM
+                return {genre_lower: self._categorize_unmapped_genre(genre_lower)}, set()
+            except Exception as e:
+                logger.error(f"Skipping genre '{genre_lower}' due to LLM error: {e}")
+                return {}, {genre_lower}
+
+        logger.info(f"{len(unmapped)} genres not in mapping - consulting LLM: {', '.join(unmapped)}")
+        try:
+            categories = self._categorize_genres_with_llm_batch(unmapped)
+        except LLMUnavailableError:
+            # LLM unreachable - treat the genres as new canonical genres
+            return {genre_lower: genre_lower for genre_lower in unmapped}, set()
+        except Exception as e:
+            logger.error(f"Skipping genres {unmapped} due to LLM error: {e}")
+            return {}, set(unmapped)
+
+        resolved: Dict[str, str] = {}
+        failed: Set[str] = set()
+        for genre_lower in unmapped:
+            if genre_lower not in categories:
+                failed.add(genre_lower)
+                continue
+
+            llm_category = categories[genre_lower]
+            if llm_category:
+                logger.info(f"LLM mapped '{genre_lower}' → '{llm_category}' - adding to genre_mapping.json")
+                self.add_alternative_to_existing(llm_category, genre_lower)
+                resolved[genre_lower] = llm_category
+            else:
+                logger.info(f"LLM found no match for '{genre_lower}' - adding as new main genre")
+                self.add_mapping(genre_lower, [])
+                resolved[genre_lower] = genre_lower
+
+        if resolved:
+            self._dirty = True
+
+        return resolved, failed
+
+    def _lookup_mapped_genre(self, genre_lower: str) -> Optional[str]:
+        """Return the canonical genre for a normalized name known to the mapping, else None."""
+        if self._mapping is None:
+            self.mapping  # Load mapping and build the index on first lookup
+        canonical = self._alt_index.get(genre_lower)
+        if canonical is None:
+            # Exact names win; fall back to punctuation/whitespace-folded variants
+            canonical = self._norm_alt_index.get(_canonicalize_key(genre_lower))
+        return canonical
+
+    def find_canonical_genre(self, genre: str) -> str:
+        """
+        Find the canonical form of a raw genre name.
+
+        Args:
+            genre: Genre name to normalize (will be stripped and lowercased).
+
+        Returns:
+            Canonical genre name (lowercase), see _find_canonical_genre.
+        """
+        try:
+            return self._find_canonical_genre(sys.intern(genre.strip().lower()))
+        finally:
+            self.flush_mapping()
+
+    def _find_canonical_genre(self, genre_lower: str) -> str:
+        """
+        Find the canonical form of an already normalized genre.
+
+        Args:
+            genre_lower: Genre name, already stripped and lowercased.
 
         Returns:
             Canonical genre name (lowercase). If genre is an alternative,
             returns the designator. If not found in mapping, returns the
-            original genre (lowercased). If LLM is enabled and finds a match,
-            adds the mapping and returns the canonical genre.
+            genre itself. If LLM is enabled and finds a match, adds the
+            mapping and returns the canonical genre.
+        """
+        # Canonical designator or known alternative - single index lookup
+        canonical = self._lookup_mapped_genre(genre_lower)
+        if canonical is not None:
+            return canonical
+
+        return self._categorize_unmapped_genre(genre_lower)
+
+    def _categorize_unmapped_genre(self, genre_lower: str) -> str:
         """
-        genre_lower = genre.lower().strip()
+        Resolve a genre known to be missing from the mapping.
 
-        # Check if it's already a canonical designator
-        if genre_lower in self.mapping:
-            return genre_lower
+        Args:
+            genre_lower: Normalized genre name not found in the mapping.
 
-        # Check if it's an alternative for any canonical genre
-        for canonical, alternatives in self.mapping.items():
-            if genre_lower in alternatives:
-                return canonical
+        Returns:
+            Canonical genre chosen by the LLM (mapping updated), or the genre
+            itself as a new canonical genre.
 
+        Raises:
+            Exception: If the LLM fails to categorize the genre.
+        """
         # Not found in mapping - try LLM categorization if enabled
         if self.use_llm and self.llm_available:
             logger.info(f"Genre '{genre_lower}' not in mapping - consulting LLM...")
@@ -292,15 +776,18 @@ Respond with ONLY the canonical genre name or "NO_FIT". No explanations, no reas
                     # LLM found a match - add to mapping as alternative
                     logger.info(f"LLM mapped '{genre_lower}' → '{llm_category}' - adding to genre_mapping.json")
                     self.add_alternative_to_existing(llm_category, genre_lower)
-                    self.save_mapping()
+                    self._dirty = True
                     return llm_category
                 else:
                     # LLM returned NO_FIT - treat as new canonical genre
                     logger.info(f"LLM found no match for '{genre_lower}' - adding as new main genre")
                     self.add_mapping(genre_lower, [])
-                    self.save_mapping()
+                    self._dirty = True
                     return genre_lower
 
+            except LLMUnavailableError:
+                # LLM unreachable - continue without it, as if it were never enabled
+                return genre_lower
             except Exception as e:
                 # LLM error - raise to skip this genre completely
                 logger.error(f"LLM categorization error for '{genre_lower}': {e}")
@@ -340,32 +827,86 @@ Respond with ONLY the canonical genre name or "NO_FIT". No explanations, no reas
         if not genres:
             return []
 
+        # Many books share identical raw genre lists - skip the loop on repeats
+        key = tuple(genres)
+        with self._cache_lock:
+            hit = self._list_cache.get(key)
+            if hit is not None:
+                self._list_cache.move_to_end(key)
+                return list(hit)
+            version = self._mapping_version
+
         canonical_genres = []
         seen: Set[str] = set()
         llm_failed_genres = []
 
-        for genre in genres:
-            if not genre or not genre.strip():
+        # First pass: resolve from cache and mapping, collecting unmapped genres.
+        # Exact duplicates collapse up front (order-preserving); case/whitespace
+        # variants ("Horror", "horror ") share one normalized key.
+        entries: List[Tuple[str, Optional[str], Optional[str]]] = []
+        unmapped: Dict[str, None] = {}
+        for genre in dict.fromkeys(genres):
+            if not genre:
                 continue
 
-            try:
-                canonical = self._find_canonical_genre(genre)
+            # Repeated raw strings ("Horror", "Fantasy") skip normalization and lookup
+            canonical = self._canon_cache.get(genre)
+            if canonical is not None:
+                entries.append((genre, None, canonical))
+                continue
 
-                # Add only if not already seen (deduplication)
-                if canonical not in seen:
-                    canonical_genres.append(canonical)
-                    seen.add(canonical)
+            genre_lower = sys.intern(genre.strip().lower())
+            if not genre_lower:
+                continue
 
-            except Exception as e:
-                # LLM error for this genre - track it
-                llm_failed_genres.append(genre)
-                logger.error(f"Skipping genre '{genre}' due to LLM error: {e}")
+            canonical = self._lookup_mapped_genre(genre_lower)
+            if canonical is None:
+                if self.use_llm and self.llm_available:
+                    unmapped[genre_lower] = None
+                else:
+                    # Not found and LLM not available - treat as new canonical genre
+                    canonical = genre_lower
+            entries.append((genre, genre_lower, canonical))
+
+        # Second pass: categorize all unmapped genres with one LLM request
+        llm_resolved: Dict[str, str] = {}
+        llm_failed: Set[str] = set()
+        if unmapped:
+            llm_resolved, llm_failed = self._resolve_unmapped_genres(list(unmapped))
+            # Write all LLM-driven mapping changes for this call at once
+            self.flush_mapping()
+
+        for genre, genre_lower, canonical in entries:
+            if canonical is None:
+                if genre_lower in llm_failed:
+                    # LLM error for this genre - track it (once per normalized genre)
+                    llm_failed.discard(genre_lower)
+                    llm_failed_genres.append(genre)
+                    continue
+                canonical = llm_resolved.get(genre_lower)
+                if canonical is None:
+                    continue
+
+            if genre_lower is not None:
+                self._remember_canonical(genre, canonical)
+
+            # Add only if not already seen (deduplication)
+            if canonical not in seen:
+                canonical_genres.append(canonical)
+                seen.add(canonical)
 
         # If any genres failed LLM categorization, raise exception to skip this book
         if llm_failed_genres:
             failed_str = ", ".join(llm_failed_genres)
             raise Exception(f"LLM failed to categorize genres: {failed_str}")
 
+        with self._cache_lock:
+            # Skip caching if the mapping changed meanwhile (e.g. LLM added genres)
+            if version == self._mapping_version:
+                self._list_cache[key] = list(canonical_genres)
+                if len(self._list_cache) > self.LIST_CACHE_SIZE:
+                    self._list_cache.popitem(last=False)
+
         return canonical_genres
 
     def add_mapping(self, canonical: str, alternatives: List[str] = None):
@@ -376,15 +917,29 @@ Respond with ONLY the canonical genre name or "NO_FIT". No explanations, no reas
             canonical: The canonical genre name (will be lowercased).
             alternatives: List of alternative names that map to this canonical form.
         """
-        canonical_lower = canonical.lower().strip()
-        alternatives_lower = [alt.lower().strip() for alt in (alternatives or [])]
+        canonical_lower = sys.intern(canonical.lower().strip())
+        alternatives_lower = [sys.intern(alt.lower().strip()) for alt in (alternatives or [])]
 
-        if canonical_lower in self.mapping:
-            # Merge with existing alternatives
-            existing = set(self.mapping[canonical_lower])
-            self.mapping[canonical_lower] = list(existing | set(alternatives_lower))
-        else:
-            self.mapping[canonical_lower] = alternatives_lower
+        with self._mut_lock:
+            if canonical_lower in self.mapping:
+                current = self.mapping[canonical_lower]
+                existing = self._alt_sets[canonical_lower]
+            else:
+                current = self.mapping[canonical_lower] = []
+                existing = self._alt_sets[canonical_lower] = set()
+                # Canonical names take precedence over alternatives in the index
+                self._alt_index[canonical_lower] = canonical_lower
+                self._norm_alt_index[_canonicalize_key(canonical_lower)] = canonical_lower
+
+            # Merge with existing alternatives, preserving order, and patch the index
+            for alt in alternatives_lower:
+                if alt not in existing:
+                    current.append(alt)
+                    existing.add(alt)
+                    self._alt_index.setdefault(alt, canonical_lower)
+                    self._norm_alt_index.setdefault(_canonicalize_key(alt), canonical_lower)
+
+            self._clear_caches()
 
     def add_alternative_to_existing(self, canonical: str, alternative: str):
         """
@@ -394,51 +949,85 @@ Respond with ONLY the canonical genre name or "NO_FIT". No explanations, no reas
             canonical: The canonical genre name (must exist in mapping).
             alternative: The alternative name to add.
         """
-        canonical_lower = canonical.lower().strip()
-        alternative_lower = alternative.lower().strip()
+        canonical_lower = sys.intern(canonical.lower().strip())
+        alternative_lower = sys.intern(alternative.lower().strip())
+
+        with self._mut_lock:
+            if canonical_lower not in self.mapping:
+                logger.error(f"Cannot add alternative '{alternative}' - canonical genre '{canonical}' not found")
+                return
+
+            alt_set = self._alt_sets[canonical_lower]
+            if alternative_lower not in alt_set:
+                self.mapping[canonical_lower].append(alternative_lower)
+                alt_set.add(alternative_lower)
+                self._alt_index.setdefault(alternative_lower, canonical_lower)
+                self._norm_alt_index.setdefault(_canonicalize_key(alternative_lower), canonical_lower)
+                self._clear_caches()
+                logger.debug(f"Added '{alternative_lower}' as alternative to '{canonical_lower}'")
 
-        if canonical_lower not in self.mapping:
-            logger.error(f"Cannot add alternative '{alternative}' - canonical genre '{canonical}' not found")
-            return
+    def save_mapping(self):
+        """
+        Save the current mapping to the JSON file.
 
-        if alternative_lower not in self.mapping[canonical_lower]:
-            self.mapping[canonical_lower].append(alternative_lower)
-            logger.debug(f"Added '{alternative_lower}' as alternative to '{canonical_lower}'")
+        Writes a temporary file and renames it over the mapping file, so readers
+        never see a partially written mapping.
+        """
+        with self._mut_lock:
+            try:
+                _write_json_atomic(self.mapping_file, self.mapping)
+                self._dirty = False
+                logger.info(f"Genre mapping saved to: {self.mapping_file}")
+            except Exception as e:
+                logger.error(f"Error saving genre mapping: {e}")
 
-    def save_mapping(self):
-        """Save the current mapping to the JSON file."""
-        try:
-            with open(self.mapping_file, 'w', encoding='utf-8') as f:
-                json.dump(self.mapping, f, indent=2, ensure_ascii=False, sort_keys=True)
-            logger.info(f"Genre mapping saved to: {self.mapping_file}")
-        except Exception as e:
-            logger.error(f"Error saving genre mapping: {e}")
+    def flush_mapping(self):
+        """Save the mapping and LLM decision cache if LLM categorization changed them since the last save."""
+        if self._dirty:
+            self.save_mapping()
+        if self._llm_cache_dirty:
+            self._save_llm_cache()
 
 
-# Global instance for easy access
-_normalizer = None
+# Shared instances for easy access, one per configuration
+_normalizer_lock = threading.Lock()
+_llm_requested = False
+
+
+@functools.cache
+def _make_normalizer(use_llm: bool) -> GenreNormalizer:
+    """Create the shared GenreNormalizer for a configuration (once per process)."""
+    return GenreNormalizer(use_llm=use_llm)
+
+
+@atexit.register
+def _flush_global_normalizer():
+    """Write pending mapping and LLM cache changes of the shared LLM normalizer at interpreter exit."""
+    if _llm_requested:
+        _make_normalizer(True).flush_mapping()
 
 
 def get_normalizer(use_llm: bool = False) -> GenreNormalizer:
     """
-    Get the global GenreNormalizer instance (singleton pattern).
+    Get the shared GenreNormalizer instance.
+
+    Each configuration is created once and reused with its loaded mapping and
+    caches. Once an LLM-enabled instance has been requested, plain requests
+    share it too, so OPF and audio tag genres use the same LLM-extended mapping.
 
     Args:
-        use_llm: Whether to enable LLM categorization. If True and instance
-                 already exists without LLM, a new instance will be created.
+        use_llm: Whether to enable LLM categorization.
 
     Returns:
         GenreNormalizer instance with requested configuration.
     """
-    global _normalizer
-
-    # If requesting LLM but current instance doesn't have it, create new one
-    if use_llm and (_normalizer is None or not _normalizer.use_llm):
-        _normalizer = GenreNormalizer(use_llm=True)
-    elif _normalizer is None:
-        _normalizer = GenreNormalizer(use_llm=False)
+    global _llm_requested
 
-    return _normalizer
+    # Lock so concurrent first calls construct a single instance
+    with _normalizer_lock:
+        if use_llm:
+            _llm_requested = True
+        return _make_normalizer(use_llm or _llm_requested)
 
 
 def normalize_genres(genres: List[str], use_llm: bool = False) -> List[str]:
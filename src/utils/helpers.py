@@ -5,17 +5,25 @@ This module contains common utility functions used across the application,
 including path manipulation, text cleaning, and validation functions.
 """
 
+import os
 import re
 import time
+import random
 import base64
+from collections import deque
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Iterator, List, Optional, Tuple
 import logging as log
 
 from ..config import AUDIO_EXTENSIONS, SCRAPER_REGISTRY
 from ..models import BookMetadata
 
 
+_FILENAME_INVALID_CHARS_REGEX = re.compile(r"[^\w\-\.\(\) ]+")
+
+
 def clean_filename(text: str) -> str:
     """
     Clean text for use in filenames by removing invalid characters.
@@ -28,7 +36,27 @@ def clean_filename(text: str) -> str:
     """
     if not text:
         return ""
-    return re.sub(r"[^\w\-\.\(\) ]+", '', text).strip()
+    return _FILENAME_INVALID_CHARS_REGEX.sub('', text).strip()
+
+
+_DIGIT_RUN_REGEX = re.compile(r'(\d+)')
+
+
+def _natural_sort_key(path: Path) -> List:
+    """Sort key ordering embedded numbers numerically ("2 - x" before "10 - x")."""
+    return [int(part) if part.isdecimal() else part
+            for part in _DIGIT_RUN_REGEX.split(str(path).lower())]
+
+
+@lru_cache(maxsize=None)
+def _load_tinytag():
+    """Import TinyTag on first use; returns None if the library is missing."""
+    try:
+        from tinytag import TinyTag
+    except ImportError:
+        log.warning("TinyTag not available, cannot extract search terms from audio files")
+        return None
+    return TinyTag
 
 
 def extract_search_terms_from_audio_files(folder_path: Path) -> Tuple[Optional[str], Optional[str]]:
@@ -41,42 +69,46 @@ def extract_search_terms_from_audio_files(folder_path: Path) -> Tuple[Optional[s
     Returns:
         Tuple of (title, author) or (None, None) if not found
     """
-    try:
-        from tinytag import TinyTag
-    except ImportError:
-        log.warning("TinyTag not available, cannot extract search terms from audio files")
+    TinyTag = _load_tinytag()
+    if TinyTag is None:
         return None, None
     
-    for file in folder_path.glob('**/*'):
-        if file.suffix.lower() in {ext.lower() for ext in AUDIO_EXTENSIONS}:
-            try:
-                track = TinyTag.get(str(file))
-                
-                # Extract and clean album/title
-                album = re.sub(r"\&", 'and', track.album).strip() if track.album else ''
-                track_title = re.sub(r"\&", 'and', track.title).strip() if track.title else ''
-                
-                # Determine best title
-                title = None
-                if album and track_title:
-                    if album.lower() != track_title.lower():
-                        title = f"{track_title} ({album})"
-                    else:
-                        title = track_title
-                elif track_title:
+    # Try files in natural track order: track 1 usually carries the canonical
+    # album/artist tags, so the first parse normally succeeds
+    audio_files = sorted(
+        (file for file in folder_path.glob('**/*') if file.suffix.lower() in AUDIO_EXTENSIONS),
+        key=_natural_sort_key
+    )
+
+    for file in audio_files:
+        try:
+            track = TinyTag.get(str(file))
+            
+            # Extract and clean album/title
+            album = re.sub(r"\&", 'and', track.album).strip() if track.album else ''
+            track_title = re.sub(r"\&", 'and', track.title).strip() if track.title else ''
+            
+            # Determine best title
+            title = None
+            if album and track_title:
+                if album.lower() != track_title.lower():
+                    title = f"{track_title} ({album})"
+                else:
                     title = track_title
-                elif album:
-                    title = album
-                
-                # Extract and clean author
-                author = re.sub(r"\&", 'and', track.artist).strip() if track.artist else None
+            elif track_title:
+                title = track_title
+            elif album:
+                title = album
+            
+            # Extract and clean author
+            author = re.sub(r"\&", 'and', track.artist).strip() if track.artist else None
+            
+            if title or author:
+                return title, author
                 
-                if title or author:
-                    return title, author
-                    
-            except Exception as e:
-                log.debug(f"Couldn't get search term metadata from ID3 tags ({file}): {e}")
-                continue
+        except Exception as e:
+            log.debug(f"Couldn't get search term metadata from ID3 tags ({file}): {e}")
+            continue
     
     return None, None
 
@@ -150,13 +182,55 @@ def has_audio_files(folder_path: Path) -> bool:
     return False
 
 
+def _walk_breadth_first(folder_str: str) -> Iterator[Tuple[str, List[os.DirEntry]]]:
+    """
+    Yield (directory, entries) for a folder tree, shallowest directories first.
+
+    Subdirectories are visited in name order and symlinked directories are not
+    followed, so every caller sees the same deterministic walk.
+    """
+    pending = deque([folder_str])
+    while pending:
+        current = pending.popleft()
+        try:
+            with os.scandir(current) as it:
+                entries = list(it)
+        except OSError as e:
+            log.warning(f"Could not scan folder {current}: {e}")
+            continue
+
+        subdirs = []
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+            except OSError as e:
+                log.debug(f"Skipping unreadable entry {entry.path}: {e}")
+
+        yield current, entries
+        pending.extend(sorted(subdirs))
+
+
+def _has_opf_beside_audio(entries: List[os.DirEntry]) -> bool:
+    """Check whether a directory listing holds metadata.opf next to audio files."""
+    has_opf = False
+    has_audio = False
+    for entry in entries:
+        if entry.name == 'metadata.opf':
+            has_opf = True
+        elif os.path.splitext(entry.name)[1].lower() in AUDIO_EXTENSIONS:
+            has_audio = True
+    return has_opf and has_audio
+
+
 def find_metadata_opf(folder_path: Path) -> Optional[Path]:
     """
     Find metadata.opf file in folder or its subdirectories.
 
     Searches in the following order:
     1. Direct child: folder/metadata.opf
-    2. In same folder as audio files (for nested structures)
+    2. In same folder as audio files (for nested structures), taking the
+       shallowest such folder and, within one depth, the first by name
 
     Args:
         folder_path: Path to search
@@ -171,14 +245,9 @@ def find_metadata_opf(folder_path: Path) -> Optional[Path]:
 
     # Search in subdirectories where audio files are located
     # This handles nested structures like: Author/Book - Author/Book/metadata.opf
-    for ext in AUDIO_EXTENSIONS:
-        audio_files = list(folder_path.rglob(f"*{ext}"))
-        if audio_files:
-            # Check for metadata.opf in the same directory as the first audio file
-            audio_folder = audio_files[0].parent
-            opf_file = audio_folder / 'metadata.opf'
-            if opf_file.exists():
-                return opf_file
+    for current, entries in _walk_breadth_first(str(folder_path)):
+        if _has_opf_beside_audio(entries):
+            return Path(current) / 'metadata.opf'
 
     return None
 
@@ -209,9 +278,16 @@ def decode_from_config(encoded_text: str) -> str:
     return base64.standard_b64decode(bytes(encoded_text, 'utf-8')).decode()
 
 
+# Default back-off schedule (base 2.0s, x1.5 per attempt, capped at 10.0s)
+_DEFAULT_BACKOFF_SCHEDULE = tuple(min(2.0 * 1.5 ** i, 10.0) for i in range(20))
+
+
 def wait_with_backoff(attempt: int, base_delay: float = 2.0, max_delay: float = 10.0) -> float:
     """
-    Calculate wait time with exponential backoff.
+    Calculate wait time with exponential backoff and sleep for it.
+    
+    A random +/-20% jitter is applied so parallel workers retrying the same
+    site don't hit it again in lockstep.
     
     Args:
         attempt: Current attempt number (starting from 1)
@@ -221,15 +297,29 @@ def wait_with_backoff(attempt: int, base_delay: float = 2.0, max_delay: float =
     Returns:
         Delay time in seconds
     """
-    delay = min(base_delay * (1.5 ** (attempt - 1)), max_delay)
+    if base_delay == 2.0 and max_delay == 10.0:
+        index = min(max(attempt, 1), len(_DEFAULT_BACKOFF_SCHEDULE)) - 1
+        delay = _DEFAULT_BACKOFF_SCHEDULE[index]
+    else:
+        delay = min(base_delay * (1.5 ** (attempt - 1)), max_delay)
+
+    delay = min(delay * random.uniform(0.8, 1.2), max_delay)
     time.sleep(delay)
     return delay
 
 
+# Trailing characters stripped from user-supplied paths (separators, quotes)
+_PATH_TRAILING_CHARS = '\\/"\''
+
+
 def validate_path(path_str: str, must_exist: bool = True) -> Optional[Path]:
     """
     Validate and normalize a path string.
     
+    Only paths that must exist are resolved; resolving touches every path
+    segment on disk, which is wasted work for paths that may not exist yet
+    (e.g. output directories).
+    
     Args:
         path_str: Path string to validate
         must_exist: Whether the path must exist
@@ -238,9 +328,11 @@ def validate_path(path_str: str, must_exist: bool = True) -> Optional[Path]:
         Path object if valid, None otherwise
     """
     try:
-        path = Path(path_str.rstrip(r'\/"\'')).resolve()
-        if must_exist and not path.exists():
-            return None
+        path = Path(path_str.rstrip(_PATH_TRAILING_CHARS))
+        if must_exist:
+            if not path.exists():
+                return None
+            path = path.resolve()
         return path
     except Exception:
         return None
@@ -278,6 +370,9 @@ def sanitize_xml_text(text: str) -> str:
     return html.escape(text if text is not None else '', quote=True)
 
 
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+
 def format_file_size(size_bytes: int) -> str:
     """
     Format file size in human-readable format.
@@ -288,18 +383,32 @@ def format_file_size(size_bytes: int) -> str:
     Returns:
         Human-readable size string
     """
-    if size_bytes == 0:
+    size_bytes = int(size_bytes)
+    if size_bytes <= 0:
         return "0 B"
-    
-    size_names = ["B", "KB", "MB", "GB", "TB"]
-    size_index = 0
-    size = float(size_bytes)
-    
-    while size >= 1024 and size_index < len(size_names) - 1:
-        size /= 1024
-        size_index += 1
-    
-    return f"{size:.1f} {size_names[size_index]}"
+
+    # Each unit is 2**10 larger, so the unit index follows from the bit length
+    size_index = min((size_bytes.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (size_index * 10)):.1f} {_SIZE_UNITS[size_index]}"
+
+
+def format_duration(seconds: float) -> str:
+    """
+    Format time duration as human-readable string.
+
+    Args:
+        seconds: Duration in seconds
+
+    Returns:
+        Formatted time string (e.g. "42.0s", "3m 7s", "1h 5m")
+    """
+    if seconds < 60:
+        return f"{seconds:.1f}s"
+
+    whole_seconds = int(seconds)
+    if whole_seconds < 3600:
+        return f"{whole_seconds // 60}m {whole_seconds % 60}s"
+    return f"{whole_seconds // 3600}h {whole_seconds % 3600 // 60}m"
 
 
 def get_folder_size(folder_path: Path) -> int:
@@ -323,6 +432,56 @@ def get_folder_size(folder_path: Path) -> int:
     return total_size
 
 
+@dataclass(frozen=True)
+class FolderScan:
+    """Snapshot of an audiobook folder gathered in a single traversal."""
+
+    total_size: int
+    audio_files: Tuple[Path, ...]
+    metadata_opf: Optional[Path]
+
+
+def scan_folder(folder_path: Path) -> FolderScan:
+    """
+    Collect folder size, audio files and metadata.opf in one recursive walk.
+
+    Replaces separate get_folder_size / find_audio_files / find_metadata_opf
+    traversals when all three are needed for the same folder.
+
+    Args:
+        folder_path: Path to the audiobook folder
+
+    Returns:
+        FolderScan with total size, sorted audio files and metadata.opf
+        (same lookup order as find_metadata_opf)
+    """
+    folder_str = str(folder_path)
+    total_size = 0
+    audio_files = []
+    metadata_opf = None
+
+    for current, entries in _walk_breadth_first(folder_str):
+        for entry in entries:
+            try:
+                if entry.is_file():
+                    total_size += entry.stat().st_size
+                    if os.path.splitext(entry.name)[1].lower() in AUDIO_EXTENSIONS:
+                        audio_files.append(entry.path)
+            except OSError as e:
+                log.debug(f"Skipping unreadable entry {entry.path}: {e}")
+
+        if metadata_opf is None:
+            if current == folder_str:
+                if any(entry.name == 'metadata.opf' for entry in entries):
+                    metadata_opf = Path(current) / 'metadata.opf'
+            elif _has_opf_beside_audio(entries):
+                metadata_opf = Path(current) / 'metadata.opf'
+
+    audio_paths = tuple(sorted(Path(f) for f in audio_files))
+
+    return FolderScan(total_size, audio_paths, metadata_opf)
+
+
 def normalize_series_volume(volume_str: str) -> str:
     """
     Normalize series volume numbers for consistent formatting.
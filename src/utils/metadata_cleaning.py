@@ -6,9 +6,19 @@ This module provides functions to clean and validate metadata from various sourc
 """
 
 import re
+import functools
+import unicodedata
+from dataclasses import dataclass, asdict
 from typing import Optional, Dict, List
 from pathlib import Path
 
+# Use pyahocorasick to scan for all garbage tokens in one pass when available (optional)
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
 
 # Patterns for detecting garbage data
 GARBAGE_PATTERNS = [
@@ -26,12 +36,67 @@ GARBAGE_PATTERNS = [
 # Compiled regex for performance
 GARBAGE_REGEX = re.compile('|'.join(GARBAGE_PATTERNS), re.IGNORECASE)
 
-# Common bracket types to remove
-BRACKET_PATTERNS = [
-    r'\[.*?\]',  # Square brackets
-    r'\(.*?\)',  # Parentheses
-    r'\{.*?\}',  # Curly braces
-]
+# Same patterns without Unicode case folding, used for pure-ASCII text where
+# both give identical results. (Applying it to non-ASCII text would change
+# \b around letters like 'ą'; non-ASCII garbage tokens would need their own
+# pattern.)
+# google-re2 was measured here and is 2-4x slower than `re` on folder-name
+# sized strings (per-call wrapper overhead dominates), so it is not used.
+_GARBAGE_REGEX_ASCII = re.compile('|'.join(GARBAGE_PATTERNS), re.IGNORECASE | re.ASCII)
+
+# Literal substrings at least one of which must be present (lowercased) for
+# GARBAGE_REGEX to match pure-ASCII text; most real titles contain none, so the
+# regex is skipped. Unicode case folding lets non-ASCII text match without them
+# ('ſtorytel', '.RİP'), so non-ASCII text always runs the full regex.
+_GARBAGE_LITERAL_TOKENS = (
+    '.pl', '.com', '.net', '.org', '.io', '.de', '.uk', '.eu', '.ru',
+    'http', 'www.',
+    'audiobook', 'exsite', 'audioteka', 'empik', 'legimi', 'storytel',
+    'rarbg', 'yify', 'eztv', 'ettv', 'rip', 'hdtv',
+)
+
+if HAS_AHOCORASICK:
+    _GARBAGE_TOKEN_AUTOMATON = ahocorasick.Automaton()
+    for _token in _GARBAGE_LITERAL_TOKENS:
+        _GARBAGE_TOKEN_AUTOMATON.add_word(_token, _token)
+    _GARBAGE_TOKEN_AUTOMATON.make_automaton()
+    del _token
+
+# Bracketed content to remove: square brackets, parentheses, curly braces
+_RE_ALL_BRACKETS = re.compile(r'\[.*?\]|\(.*?\)|\{.*?\}')
+
+# Precompiled patterns used on every cleaning call
+_RE_DASH_UNDER_COLON = re.compile(r'[-_:]+')
+
+# Latin-1 characters that are not alphanumeric (the [\W_] class), for str.strip()
+_EDGE_STRIP = ''.join(chr(code) for code in range(256) if not chr(code).isalnum())
+_RE_NON_LETTER = re.compile(r'[^a-zA-Z]')
+
+# Filler words that don't add search value, removed before comparing search terms
+_FILLER_WORDS = ('by', 'czyta', 'reads', 'narrated', 'audiobook', 'kbps', 'mp3')
+_RE_FILLER_WORDS = re.compile(r'\b(?:' + '|'.join(_FILLER_WORDS) + r')\b')
+_RE_NON_ALNUM_SPACE = re.compile(r'[^a-z0-9\s]')
+
+
+def _strip_non_alnum_edges(text: str) -> str:
+    """Remove leading/trailing characters that are not alphanumeric."""
+    result = text.strip(_EDGE_STRIP)
+    # Rare non-Latin-1 punctuation (e.g. '…', '—') left at the edges
+    if result and not (result[0].isalnum() and result[-1].isalnum()):
+        start, end = 0, len(result)
+        while start < end and not result[start].isalnum():
+            start += 1
+        while end > start and not result[end - 1].isalnum():
+            end -= 1
+        result = result[start:end]
+    return result
+
+
+def _contains_garbage_token(lowered: str) -> bool:
+    """Check whether lowercased text contains any of the garbage literal tokens."""
+    if HAS_AHOCORASICK:
+        return next(_GARBAGE_TOKEN_AUTOMATON.iter(lowered), None) is not None
+    return any(token in lowered for token in _GARBAGE_LITERAL_TOKENS)
 
 
 def is_garbage_data(text: str) -> bool:
@@ -55,18 +120,26 @@ def is_garbage_data(text: str) -> bool:
     if not text or not isinstance(text, str):
         return True
 
+    return _is_garbage_data_fast(text)
+
+
+def _is_garbage_data_fast(text: str) -> bool:
+    """is_garbage_data() for callers that already guarantee a str."""
     text = text.strip()
 
     # Empty or very short strings
     if len(text) < 3:
         return True
 
-    # Check against garbage patterns
-    if GARBAGE_REGEX.search(text):
+    # Check against garbage patterns, confirming literal hits with the regex
+    if text.isascii():
+        if _contains_garbage_token(text.lower()) and _GARBAGE_REGEX_ASCII.search(text):
+            return True
+    elif GARBAGE_REGEX.search(text):
         return True
 
     # Text is only punctuation/special characters
-    if re.match(r'^[\W_]+$', text):
+    if not any(char.isalnum() for char in text):
         return True
 
     return False
@@ -92,7 +165,13 @@ def is_duplicate_fields(title: Optional[str], author: Optional[str]) -> bool:
     if not title or not author:
         return False
 
-    return title.strip().lower() == author.strip().lower()
+    title = title.strip()
+    author = author.strip()
+    # Different lengths can't match; skip the lower() copies
+    if len(title) != len(author):
+        return False
+
+    return title.lower() == author.lower()
 
 
 def clean_metadata_text(text: str, remove_brackets: bool = True,
@@ -117,21 +196,25 @@ def clean_metadata_text(text: str, remove_brackets: bool = True,
     if not text or not isinstance(text, str):
         return ""
 
+    return _clean_metadata_text_fast(text, remove_brackets, remove_special_chars)
+
+
+def _clean_metadata_text_fast(text: str, remove_brackets: bool = True,
+                              remove_special_chars: bool = True) -> str:
+    """clean_metadata_text() for callers that already guarantee a str."""
     result = text.strip()
 
     # Remove content in brackets
     if remove_brackets:
-        for pattern in BRACKET_PATTERNS:
-            result = re.sub(pattern, '', result)
+        result = _RE_ALL_BRACKETS.sub('', result)
 
     # Remove special characters that hurt search
     if remove_special_chars:
-        # Replace dashes and underscores with spaces
-        result = re.sub(r'[-_]+', ' ', result)
-        # Remove colons (often used in "Author: Name" format)
-        result = re.sub(r':', ' ', result)
-        # Remove multiple spaces
-        result = re.sub(r'\s+', ' ', result)
+        # Replace dashes, underscores and colons (often used in
+        # "Author: Name" format) with spaces
+        result = _RE_DASH_UNDER_COLON.sub(' ', result)
+        # Remove multiple spaces (also trims the ends)
+        return ' '.join(result.split())
 
     return result.strip()
 
@@ -188,28 +271,45 @@ def clean_id3_field(field_value: str) -> str:
     if is_garbage_data(field_value):
         return ""
 
+    return _light_clean_id3_value(field_value)
+
+
+def _light_clean_id3_value(field_value: str) -> str:
+    """
+    Clean an ID3 value already known not to be garbage.
+
+    Args:
+        field_value: Raw ID3 field value that passed is_garbage_data()
+
+    Returns:
+        Cleaned field value, or empty string if too little text remains
+    """
     # Light cleaning - don't remove dashes/special chars from ID3
     # (they might be legitimate parts of titles like "Harry Potter - Book 1")
     result = field_value.strip()
 
     # Only remove leading/trailing special characters
-    result = re.sub(r'^[\W_]+|[\W_]+$', '', result)
-
-    # Remove multiple spaces
-    result = re.sub(r'\s+', ' ', result)
+    result = _strip_non_alnum_edges(result)
 
-    result = result.strip()
+    # Remove multiple spaces (also trims the ends)
+    result = ' '.join(result.split())
 
     # Additional validation: check if meaningful content remains
     # after removing numbers and special characters
     # This catches cases like "1. I" or "2. A" where the actual text is too short
-    alphanumeric_only = re.sub(r'[^a-zA-Z]', '', result)
+    alphanumeric_only = _RE_NON_LETTER.sub('', result)
     if len(alphanumeric_only) < 3:
         return ""
 
     return result
 
 
+@functools.lru_cache(maxsize=512)
+def _clean_folder_name_cached(folder_name: str) -> str:
+    """Clean a folder name for searching (cached, retries re-extract the same folder)."""
+    return _clean_metadata_text_fast(folder_name)
+
+
 def extract_metadata_from_sources(
     folder_path: Path,
     id3_title: Optional[str] = None,
@@ -271,9 +371,9 @@ def extract_metadata_from_sources(
         'id3': {}
     }
 
-    # Process folder name
+    # Process folder name (Path.name is always a str)
     folder_name = folder_path.name
-    cleaned_folder = clean_folder_name(folder_name)
+    cleaned_folder = _clean_folder_name_cached(folder_name)
 
     result['folder'] = {
         'raw': folder_name,
@@ -281,19 +381,19 @@ def extract_metadata_from_sources(
         'valid': len(cleaned_folder) >= 3
     }
 
-    # Process ID3 tags
-    cleaned_title = clean_id3_field(id3_title) if id3_title else ""
-    cleaned_author = clean_id3_field(id3_author) if id3_author else ""
+    # Process ID3 tags, checking title/author for garbage once and reusing
+    # the verdict for both cleaning and the garbage indicator
+    title_garbage = bool(id3_title) and is_garbage_data(id3_title)
+    author_garbage = bool(id3_author) and is_garbage_data(id3_author)
+
+    cleaned_title = _light_clean_id3_value(id3_title) if id3_title and not title_garbage else ""
+    cleaned_author = _light_clean_id3_value(id3_author) if id3_author and not author_garbage else ""
     cleaned_album = clean_id3_field(id3_album) if id3_album else ""
 
     # Check for garbage indicators
-    garbage_detected = False
-    if id3_title and is_garbage_data(id3_title):
-        garbage_detected = True
-    if id3_author and is_garbage_data(id3_author):
-        garbage_detected = True
-    if is_duplicate_fields(id3_title, id3_author):
-        garbage_detected = True
+    garbage_detected = (
+        title_garbage or author_garbage or is_duplicate_fields(id3_title, id3_author)
+    )
 
     result['id3'] = {
         'title': cleaned_title,
@@ -319,8 +419,6 @@ def _normalize_for_comparison(text: str) -> str:
     Returns:
         Normalized text for comparison
     """
-    import unicodedata
-
     # Normalize Unicode characters (e.g., ś -> s)
     result = unicodedata.normalize('NFKD', text)
     result = result.encode('ascii', 'ignore').decode('ascii')
@@ -328,14 +426,17 @@ def _normalize_for_comparison(text: str) -> str:
     # Convert to lowercase
     result = result.lower()
     # Remove common filler words that don't add search value
-    filler_words = ['by', 'czyta', 'reads', 'narrated', 'audiobook', 'kbps', 'mp3']
-    for word in filler_words:
-        result = re.sub(rf'\b{word}\b', '', result)
+    result = _RE_FILLER_WORDS.sub('', result)
     # Remove all non-alphanumeric except spaces
-    result = re.sub(r'[^a-z0-9\s]', '', result)
+    result = _RE_NON_ALNUM_SPACE.sub('', result)
     # Collapse multiple spaces
-    result = re.sub(r'\s+', ' ', result)
-    return result.strip()
+    return ' '.join(result.split())
+
+
+@functools.lru_cache(maxsize=1024)
+def _comparison_words(text: str) -> frozenset:
+    """Return the normalized word set of a search term (cached, terms repeat across pairs)."""
+    return frozenset(_normalize_for_comparison(text).split())
 
 
 def _is_redundant_search(term1: str, term2: str, threshold: float = 0.8) -> bool:
@@ -356,15 +457,8 @@ def _is_redundant_search(term1: str, term2: str, threshold: float = 0.8) -> bool
         >>> _is_redundant_search("Book Title", "Different Author")
         False
     """
-    norm1 = _normalize_for_comparison(term1)
-    norm2 = _normalize_for_comparison(term2)
-
-    if not norm1 or not norm2:
-        return False
-
-    # Split into word sets
-    words1 = set(norm1.split())
-    words2 = set(norm2.split())
+    words1 = _comparison_words(term1)
+    words2 = _comparison_words(term2)
 
     if not words1 or not words2:
         return False
@@ -374,12 +468,26 @@ def _is_redundant_search(term1: str, term2: str, threshold: float = 0.8) -> bool
     larger_set = words2 if len(words1) < len(words2) else words1
 
     overlap = len(smaller_set & larger_set)
-    similarity = overlap / len(smaller_set) if len(smaller_set) > 0 else 0
+    similarity = overlap / len(smaller_set)
 
     return similarity >= threshold
 
 
-def generate_search_alternatives(metadata: Dict[str, Dict[str, str]]) -> List[Dict[str, str]]:
+@dataclass(frozen=True, slots=True)
+class SearchAlternative:
+    """One search term candidate generated from a metadata source."""
+
+    source: str  # 'id3' or 'folder'
+    term: str
+    priority: int
+    details: str = ''
+
+    def to_dict(self) -> Dict[str, object]:
+        """Return the alternative as a plain dict (for logging or JSON)."""
+        return asdict(self)
+
+
+def generate_search_alternatives(metadata: Dict[str, Dict[str, str]]) -> List[SearchAlternative]:
     """
     Generate search term alternatives from multiple metadata sources.
 
@@ -390,10 +498,10 @@ def generate_search_alternatives(metadata: Dict[str, Dict[str, str]]) -> List[Di
         metadata: Dictionary from extract_metadata_from_sources()
 
     Returns:
-        List of search alternatives with priority order:
+        List of SearchAlternative records, built in priority order:
         [
-            {'source': 'id3', 'term': 'Title by Author', 'priority': 1},
-            {'source': 'folder', 'term': 'Cleaned Folder Name', 'priority': 2}
+            SearchAlternative(source='id3', term='Title by Author', priority=1, ...),
+            SearchAlternative(source='folder', term='Cleaned Folder Name', priority=2, ...)
         ]
 
     Examples:
@@ -401,8 +509,8 @@ def generate_search_alternatives(metadata: Dict[str, Dict[str, str]]) -> List[Di
         ...     'folder': {'cleaned': 'Frankiewicz Janusz Gorejące ognie', 'valid': True},
         ...     'id3': {'title': '', 'author': '', 'valid': False, 'garbage_detected': True}
         ... }
-        >>> generate_search_alternatives(metadata)
-        [{'source': 'folder', 'term': 'Frankiewicz Janusz Gorejące ognie', 'priority': 1}]
+        >>> [alt.term for alt in generate_search_alternatives(metadata)]
+        ['Frankiewicz Janusz Gorejące ognie']
     """
     alternatives = []
 
@@ -410,35 +518,33 @@ def generate_search_alternatives(metadata: Dict[str, Dict[str, str]]) -> List[Di
     id3_data = metadata.get('id3', {})
     if id3_data.get('valid') and not id3_data.get('garbage_detected'):
         if id3_data['title'] and id3_data['author']:
-            alternatives.append({
-                'source': 'id3',
-                'term': f"{id3_data['title']} by {id3_data['author']}",
-                'priority': 1,
-                'details': f"Title: {id3_data['title']}, Author: {id3_data['author']}"
-            })
+            alternatives.append(SearchAlternative(
+                source='id3',
+                term=f"{id3_data['title']} by {id3_data['author']}",
+                priority=1,
+                details=f"Title: {id3_data['title']}, Author: {id3_data['author']}"
+            ))
 
     # Priority 2: Folder name (always include if valid)
     folder_data = metadata.get('folder', {})
     if folder_data.get('valid'):
-        folder_alternative = {
-            'source': 'folder',
-            'term': folder_data['cleaned'],
-            'priority': 2 if alternatives else 1,  # Priority 1 if ID3 invalid
-            'details': f"Folder: {folder_data['raw']}"
-        }
+        folder_alternative = SearchAlternative(
+            source='folder',
+            term=folder_data['cleaned'],
+            priority=2 if alternatives else 1,  # Priority 1 if ID3 invalid
+            details=f"Folder: {folder_data['raw']}"
+        )
 
         # Check if folder search would be redundant
         is_redundant = False
         if alternatives:
             for existing in alternatives:
-                if _is_redundant_search(folder_alternative['term'], existing['term']):
+                if _is_redundant_search(folder_alternative.term, existing.term):
                     is_redundant = True
                     break
 
         if not is_redundant:
             alternatives.append(folder_alternative)
 
-    # Sort by priority
-    alternatives.sort(key=lambda x: x['priority'])
-
+    # Already in priority order: entries are appended with increasing priority
     return alternatives
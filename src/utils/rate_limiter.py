@@ -4,11 +4,11 @@ Domain-based rate limiting for web scraping.
 Prevents multiple workers from overwhelming a single domain with concurrent requests.
 """
 
+import functools
 import threading
 import time
 import logging as log
-from typing import Dict
-from urllib.parse import urlparse
+from typing import Dict, List, Tuple
 
 
 class DomainRateLimiter:
@@ -19,9 +19,10 @@ class DomainRateLimiter:
     preventing HTTP 429 (rate limiting) errors from services.
     """
 
-    _locks: Dict[str, threading.Lock] = {}
-    _lock_mutex = threading.Lock()  # Protects the _locks dictionary
-    _last_request: Dict[str, float] = {}  # Track last request time per domain
+    # Per-domain record: (lock, [last request time]); the one-element list is
+    # updated in place so the dict is only touched once per request
+    _domains: Dict[str, Tuple[threading.Lock, List[float]]] = {}
+    _lock_mutex = threading.Lock()  # Serializes inserts into _domains
     _min_delay = 0.5  # Minimum delay between requests to same domain (seconds)
 
     @classmethod
@@ -38,25 +39,28 @@ class DomainRateLimiter:
         """
         domain = cls._extract_domain(url)
 
-        # Get or create lock for this domain
-        with cls._lock_mutex:
-            if domain not in cls._locks:
-                cls._locks[domain] = threading.Lock()
-                cls._last_request[domain] = 0
-            domain_lock = cls._locks[domain]
+        # Get or create the record for this domain. Known domains are read
+        # without the mutex (dict lookups are atomic); only first sightings take it.
+        # (monotonic time has an arbitrary origin, so new domains start at -inf)
+        try:
+            record = cls._domains[domain]
+        except KeyError:
+            with cls._lock_mutex:
+                record = cls._domains.setdefault(domain, (threading.Lock(), [float('-inf')]))
+        domain_lock, last_request = record
 
         # Acquire the domain lock (blocks if another worker is using it)
         domain_lock.acquire()
 
         # Ensure minimum delay since last request
-        elapsed = time.time() - cls._last_request[domain]
+        elapsed = time.monotonic() - last_request[0]
         if elapsed < cls._min_delay:
             wait_time = cls._min_delay - elapsed
             log.debug(f"Rate limiting {domain}: waiting {wait_time:.2f}s")
             time.sleep(wait_time)
 
         # Update last request time
-        cls._last_request[domain] = time.time()
+        last_request[0] = time.monotonic()
 
     @classmethod
     def release(cls, url: str) -> None:
@@ -68,20 +72,36 @@ class DomainRateLimiter:
         """
         domain = cls._extract_domain(url)
 
-        with cls._lock_mutex:
-            if domain in cls._locks:
-                cls._locks[domain].release()
+        try:
+            domain_lock = cls._domains[domain][0]
+        except KeyError:
+            return
+        domain_lock.release()
 
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def _extract_domain(url: str) -> str:
         """
         Extract domain from URL for rate limiting.
 
+        Cached because acquire() and release() parse the same URL, and scrapers
+        revisit the same few search URLs.
+
         Args:
             url: Full URL
 
         Returns:
             Domain name (e.g., 'lubimyczytac.pl')
         """
-        parsed = urlparse(url)
-        return parsed.netloc or 'unknown'
+        # Only the host[:port] part is needed, so slice it out directly
+        # instead of running the full urlparse machinery
+        scheme_end = url.find('://')
+        start = scheme_end + 3 if scheme_end != -1 else 0
+        end = len(url)
+        for delimiter in '/?#':
+            index = url.find(delimiter, start, end)
+            if index != -1:
+                end = index
+        # Drop optional user[:password]@ credentials
+        start = url.rfind('@', start, end) + 1 or start
+        return url[start:end] or 'unknown'
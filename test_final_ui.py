@@ -4,11 +4,6 @@
 import sys
 from pathlib import Path
 
-# Add the src directory to the Python path
-root_dir = Path(__file__).parent
-src_dir = root_dir / 'src'
-sys.path.insert(0, str(src_dir))
-
 def test_complete_implementation():
     """Test the complete UI improvements implementation."""
     
@@ -109,5 +104,8 @@ def test_complete_implementation():
         return False
 
 if __name__ == "__main__":
+    # Add the src directory to the Python path (only when run as a script,
+    # so importing this module stays free of side effects)
+    sys.path.insert(0, str(Path(__file__).parent / 'src'))
     success = test_complete_implementation()
     sys.exit(0 if success else 1)
@@ -3,7 +3,12 @@ Test script to verify queue system infrastructure.
 Tests QueueManager, FileLockManager, and database operations.
 """
 
+import atexit
 import sys
+import tempfile
+import threading
+import time
+import traceback
 from pathlib import Path
 
 # Add src to path
@@ -12,9 +17,21 @@ sys.path.insert(0, str(Path(__file__).parent / 'src'))
 from src.queue_manager import QueueManager
 from src.utils.file_locks import FileLockManager
 from src.models import ProcessingArgs
-import tempfile
-import threading
-import time
+
+# One scratch directory and queue database shared by all tests in this script;
+# each test clears the tables it uses instead of creating a fresh directory
+_TMP = tempfile.TemporaryDirectory()
+atexit.register(_TMP.cleanup)
+_DB = Path(_TMP.name) / 'queue.db'
+
+
+def _open_clean_queue() -> QueueManager:
+    """Open the shared queue database with empty jobs/tasks/locks tables."""
+    qm = QueueManager(_DB)
+    qm.connection.executescript(
+        "BEGIN; DELETE FROM file_locks; DELETE FROM tasks; DELETE FROM jobs; COMMIT;"
+    )
+    return qm
 
 
 def test_queue_manager():
@@ -23,13 +40,9 @@ def test_queue_manager():
     print("TEST 1: QueueManager Basic Operations")
     print("="*60)
 
-    # Create temporary database
-    temp_dir = Path(tempfile.mkdtemp())
-    db_path = temp_dir / 'test_queue.db'
-
     try:
-        qm = QueueManager(db_path)
-        print(f"✓ Created QueueManager with database at {db_path}")
+        qm = _open_clean_queue()
+        print(f"✓ Created QueueManager with database at {_DB}")
 
         # Create a job
         args = ProcessingArgs(
@@ -48,9 +61,11 @@ def test_queue_manager():
         assert job['status'] == 'pending'
         print(f"✓ Retrieved job with status: {job['status']}")
 
-        # Create tasks
-        task1_id = qm.create_task(job_id, Path('/test/book1'), 'http://example.com/book1')
-        task2_id = qm.create_task(job_id, Path('/test/book2'), 'http://example.com/book2')
+        # Create tasks (one batch insert for both)
+        task1_id, task2_id = qm.create_tasks(job_id, [
+            (Path('/test/book1'), 'http://example.com/book1'),
+            (Path('/test/book2'), 'http://example.com/book2'),
+        ])
         print(f"✓ Created 2 tasks: {task1_id[:8]}..., {task2_id[:8]}...")
 
         # Get progress
@@ -90,14 +105,8 @@ def test_queue_manager():
 
     except Exception as e:
         print(f"\n❌ QueueManager test failed: {e}")
-        import traceback
         traceback.print_exc()
         return False
-    finally:
-        # Cleanup
-        import shutil
-        if temp_dir.exists():
-            shutil.rmtree(temp_dir)
 
     return True
 
@@ -108,39 +117,28 @@ def test_file_locks():
     print("TEST 2: FileLockManager Concurrent Operations")
     print("="*60)
 
-    temp_dir = Path(tempfile.mkdtemp())
-    db_path = temp_dir / 'test_locks.db'
-
     try:
-        # Create database for locks
-        import sqlite3
-        conn = sqlite3.connect(str(db_path), check_same_thread=False)
-        cursor = conn.cursor()
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS file_locks (
-                lock_path TEXT PRIMARY KEY,
-                locked_by_task TEXT NOT NULL,
-                acquired_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        conn.commit()
-
-        lock_manager = FileLockManager(conn)
+        # Locks live in the shared queue database's file_locks table
+        qm = _open_clean_queue()
+
+        lock_manager = FileLockManager(qm.connection)
         print(f"✓ Created FileLockManager with database-based locks")
 
-        test_dir = temp_dir / 'test_author'
-        lock_order = []
+        test_dir = Path(_TMP.name) / 'test_author'
+        # (worker_id, acquired_at, released_at) per lock hold, from perf_counter()
+        lock_intervals = []
+        # Release all workers at once so they contend for the lock without sleeps
+        barrier = threading.Barrier(5)
 
         def create_directory_with_lock(worker_id: int):
             """Simulate worker trying to create directory."""
             task_id = f"task-{worker_id}"
             try:
+                barrier.wait(timeout=2.0)
                 with lock_manager.lock_directory(test_dir, task_id, timeout=5.0):
-                    lock_order.append(worker_id)
-                    if not test_dir.exists():
-                        time.sleep(0.01)  # Simulate race window
-                        test_dir.mkdir(parents=True, exist_ok=True)
-                    time.sleep(0.05)  # Hold lock briefly
+                    acquired_at = time.perf_counter()
+                    test_dir.mkdir(parents=True, exist_ok=True)
+                    lock_intervals.append((worker_id, acquired_at, time.perf_counter()))
             except TimeoutError:
                 print(f"  Worker {worker_id}: Lock timeout (expected if lock held)")
 
@@ -157,25 +155,23 @@ def test_file_locks():
 
         print(f"✓ All 5 threads completed")
         print(f"✓ Directory created: {test_dir.exists()}")
-        print(f"✓ Lock acquisition order: {lock_order}")
+        lock_intervals.sort(key=lambda interval: interval[1])
+        print(f"✓ Lock acquisition order: {[worker_id for worker_id, _, _ in lock_intervals]}")
 
-        # Verify directory was created exactly once
+        # Verify every worker held the lock and no two holds overlapped
+        assert len(lock_intervals) == 5
+        for (_, _, released_at), (_, next_acquired_at, _) in zip(lock_intervals, lock_intervals[1:]):
+            assert released_at <= next_acquired_at, "Lock holds overlapped"
         assert test_dir.exists()
-        print(f"✓ No race condition detected - directory safely created")
+        print(f"✓ No race condition detected - lock holds never overlapped")
 
-        conn.close()
+        qm.close()
         print("\n✅ All FileLockManager tests passed!")
 
     except Exception as e:
         print(f"\n❌ FileLockManager test failed: {e}")
-        import traceback
         traceback.print_exc()
         return False
-    finally:
-        # Cleanup
-        import shutil
-        if temp_dir.exists():
-            shutil.rmtree(temp_dir)
 
     return True
 
@@ -219,7 +215,6 @@ def test_imports():
 
     except Exception as e:
         print(f"\n❌ Import test failed: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
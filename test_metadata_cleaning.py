@@ -3,8 +3,8 @@ Quick test script for metadata cleaning functionality.
 Run this to validate the new metadata extraction and cleaning logic.
 """
 
-from pathlib import Path
 import sys
+from pathlib import Path
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
@@ -158,7 +158,7 @@ def test_search_alternatives():
     alternatives1 = generate_search_alternatives(metadata1)
     print(f"    Generated {len(alternatives1)} alternative(s):")
     for alt in alternatives1:
-        print(f"      [{alt['priority']}] {alt['source']}: {alt['term']}")
+        print(f"      [{alt.priority}] {alt.source}: {alt.term}")
 
     # Case 2: Good ID3 (should use both)
     print("\n  Case 2: Good ID3 - Should Use Both Sources")
@@ -179,7 +179,7 @@ def test_search_alternatives():
     alternatives2 = generate_search_alternatives(metadata2)
     print(f"    Generated {len(alternatives2)} alternative(s):")
     for alt in alternatives2:
-        print(f"      [{alt['priority']}] {alt['source']}: {alt['term']}")
+        print(f"      [{alt.priority}] {alt.source}: {alt.term}")
 
 
 def main():
@@ -34,17 +34,17 @@ def test_clean_id3_field():
         ("12", "", "Should reject: only numbers"),
     ]
 
-    all_passed = True
+    # Only mismatches are reported; the summary lists the overall result
+    fails = 0
     for input_val, expected, description in test_cases:
         result = clean_id3_field(input_val)
-        passed = result == expected
-        all_passed = all_passed and passed
+        if result != expected:
+            fails += 1
+            print(f"✗ {description}")
+            print(f"  Input: '{input_val}' → Output: '{result}' (expected: '{expected}')")
 
-        status = "✓" if passed else "✗"
-        print(f"{status} {description}")
-        print(f"  Input: '{input_val}' → Output: '{result}' (expected: '{expected}')")
-
-    return all_passed
+    print(f"{len(test_cases) - fails}/{len(test_cases)} cases passed")
+    return fails == 0
 
 
 def test_is_redundant_search():
@@ -62,20 +62,20 @@ def test_is_redundant_search():
          "ID3 term is subset of folder - redundant"),
     ]
 
-    all_passed = True
+    # Only mismatches are reported; the summary lists the overall result
+    fails = 0
     for term1, term2, expected, description in test_cases:
         result = _is_redundant_search(term1, term2)
-        passed = result == expected
-        all_passed = all_passed and passed
-
-        status = "✓" if passed else "✗"
-        print(f"{status} {description}")
-        print(f"  Term1: '{term1}'")
-        print(f"  Term2: '{term2}'")
-        print(f"  Result: {result} (expected: {expected})")
-        print(f"  Normalized: '{_normalize_for_comparison(term1)}' vs '{_normalize_for_comparison(term2)}'")
+        if result != expected:
+            fails += 1
+            print(f"✗ {description}")
+            print(f"  Term1: '{term1}'")
+            print(f"  Term2: '{term2}'")
+            print(f"  Result: {result} (expected: {expected})")
+            print(f"  Normalized: '{_normalize_for_comparison(term1)}' vs '{_normalize_for_comparison(term2)}'")
 
-    return all_passed
+    print(f"{len(test_cases) - fails}/{len(test_cases)} cases passed")
+    return fails == 0
 
 
 def test_extract_metadata_from_sources():
@@ -144,9 +144,9 @@ def test_generate_search_alternatives():
     alternatives = generate_search_alternatives(metadata)
     print(f"  Number of alternatives: {len(alternatives)}")
     for i, alt in enumerate(alternatives):
-        print(f"  [{i+1}] {alt['source']}: '{alt['term']}'")
+        print(f"  [{i+1}] {alt.source}: '{alt.term}'")
 
-    if len(alternatives) == 1 and alternatives[0]['source'] == 'folder':
+    if len(alternatives) == 1 and alternatives[0].source == 'folder':
         print("  ✓ Correctly generated only folder-based search")
     else:
         print("  ✗ Should have only 1 folder-based alternative")
@@ -163,7 +163,7 @@ def test_generate_search_alternatives():
     alternatives2 = generate_search_alternatives(metadata2)
     print(f"  Number of alternatives: {len(alternatives2)}")
     for i, alt in enumerate(alternatives2):
-        print(f"  [{i+1}] {alt['source']}: '{alt['term']}'")
+        print(f"  [{i+1}] {alt.source}: '{alt.term}'")
 
     # Both should be present since the folder has extra info (narrator, bitrate)
     # But if they're too similar, deduplication should kick in
@@ -180,7 +180,7 @@ def test_generate_search_alternatives():
     alternatives3 = generate_search_alternatives(metadata3)
     print(f"  Number of alternatives: {len(alternatives3)}")
     for i, alt in enumerate(alternatives3):
-        print(f"  [{i+1}] {alt['source']}: '{alt['term']}'")
+        print(f"  [{i+1}] {alt.source}: '{alt.term}'")
 
     if len(alternatives3) == 2:
         print("  ✓ Correctly kept both alternatives (not redundant)")
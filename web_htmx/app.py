@@ -96,9 +96,13 @@ if __name__ == '__main__':
     print("Starting server on http://localhost:5000")
     print("Press Ctrl+C to stop")
 
+    # Debugger and reloader only on request (FLASK_DEBUG=1); the reloader
+    # imports the app twice and stats every module on each check
+    debug = os.environ.get('FLASK_DEBUG') == '1'
+
     app.run(
         host='0.0.0.0',
         port=5000,
-        debug=True,
-        use_reloader=True
+        debug=debug,
+        use_reloader=debug
     )
@@ -5,12 +5,15 @@ Provides endpoints for browsing the filesystem and selecting audiobook folders.
 Handles Windows drive detection, audiobook folder identification, and folder selection.
 """
 
+import functools
 import os
 import string
 from pathlib import Path
 
 from flask import Blueprint, request, jsonify, render_template, session
 
+from src.config import AUDIO_EXTENSIONS
+
 bp = Blueprint('browse', __name__, url_prefix='/browse')
 
 
@@ -29,8 +32,10 @@ def list_drives():
             drive_path = f"{letter}:\\"
             if os.path.exists(drive_path):
                 try:
-                    # Test if drive is accessible
-                    os.listdir(drive_path)
+                    # Test if drive is accessible (opening the root is enough,
+                    # no need to list it)
+                    with os.scandir(drive_path):
+                        pass
                     drives.append({
                         'name': f"{letter}: Drive",
                         'path': drive_path,
@@ -105,18 +110,22 @@ def browse_path():
         # List directory items
         items = []
         try:
-            for item in sorted(current_path.iterdir()):
-                if item.is_dir():
-                    # Check if it might be an audiobook folder
-                    audio_count, is_audiobook = count_audio_files(item)
-
-                    items.append({
-                        'name': item.name,
-                        'path': str(item),
-                        'type': 'audiobook' if is_audiobook else 'folder',
-                        'accessible': True,
-                        'audio_count': audio_count
-                    })
+            # Collect only subdirectories from one directory read; files are never listed
+            with os.scandir(current_path) as entries:
+                subdirs = [entry for entry in entries if entry.is_dir()]
+            subdirs.sort(key=lambda entry: os.path.normcase(entry.name))
+
+            for entry in subdirs:
+                # Check if it might be an audiobook folder
+                audio_count, is_audiobook = count_audio_files(Path(entry.path))
+
+                items.append({
+                    'name': entry.name,
+                    'path': entry.path,
+                    'type': 'audiobook' if is_audiobook else 'folder',
+                    'accessible': True,
+                    'audio_count': audio_count
+                })
         except (PermissionError, OSError) as e:
             return render_template('partials/file_browser_list.html',
                                   error=f'Access denied: {e}'), 403
@@ -209,25 +218,39 @@ def count_audio_files(folder_path: Path) -> tuple:
     """
     Count audio files in a folder to determine if it's an audiobook.
 
+    Results are cached per folder and modification time, so re-browsing a
+    directory doesn't rescan unchanged subfolders.
+
     Args:
         folder_path: Path to folder
 
     Returns:
         Tuple of (count, is_audiobook)
     """
-    audio_extensions = ['.mp3', '.m4a', '.m4b', '.flac', '.ogg', '.wma']
-    audio_files = []
+    try:
+        # A folder's mtime changes whenever entries are added, removed or renamed
+        mtime_ns = folder_path.stat().st_mtime_ns
+    except (PermissionError, OSError):
+        return 0, False
+
+    return _count_audio_files_cached(str(folder_path), mtime_ns)
+
+
+@functools.lru_cache(maxsize=8192)
+def _count_audio_files_cached(folder: str, mtime_ns: int) -> tuple:
+    """Scan a folder for audio files (cached by path and mtime)."""
+    count = 0
 
     try:
-        for ext in audio_extensions:
-            audio_files.extend(list(folder_path.glob(f'*{ext}')))
-            if len(audio_files) > 0:
-                # Stop checking if we found audio files
-                break
+        # One directory read, matching extensions case-insensitively
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                if (os.path.splitext(entry.name)[1].lower() in AUDIO_EXTENSIONS
+                        and entry.is_file()):
+                    count += 1
     except (PermissionError, OSError):
         pass
 
-    count = len(audio_files)
     is_audiobook = count > 0
 
     return count, is_audiobook
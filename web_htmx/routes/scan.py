@@ -4,8 +4,8 @@ Scan Planning Routes
 Handles form submission, validation, and job creation for audiobook scanning.
 """
 
-import threading
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict
 
@@ -21,6 +21,10 @@ bp = Blueprint('scan', __name__, url_prefix='/scan')
 # Initialize QueueManager
 queue_manager = QueueManager()
 
+# Bounded pool for job start-up (enqueueing tasks and launching workers), so
+# bursts of submissions queue up instead of spawning a thread each
+_job_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='scan-job')
+
 
 @bp.route('/validate', methods=['POST'])
 def validate_form():
@@ -135,17 +139,11 @@ def start_scan():
         user_id = session.get('user_id', 'web_user')
         job_id = queue_manager.create_job(processing_args, user_id=user_id)
 
-        # Create tasks (one per folder)
-        for folder in selected_folders:
-            queue_manager.create_task(job_id, Path(folder), url=None)
+        # Create tasks (one per folder) in a single batch insert
+        queue_manager.create_tasks(job_id, [(Path(folder), None) for folder in selected_folders])
 
         # Start background processing
-        thread = threading.Thread(
-            target=process_in_background,
-            args=(job_id, processing_args.workers),
-            daemon=True
-        )
-        thread.start()
+        _job_executor.submit(process_in_background, job_id, processing_args.workers)
 
         # Clear selected folders
         session['selected_folders'] = []
@@ -4,6 +4,8 @@ Task Management Routes
 Provides endpoints for viewing and managing processing tasks.
 """
 
+import logging as log
+
 from flask import Blueprint, request, render_template, session, jsonify
 
 from src.queue_manager import QueueManager
@@ -56,9 +58,7 @@ def current_tasks():
                               job=job)
     except Exception as e:
         # Log the error and return empty state
-        import traceback
-        print(f"ERROR in current_tasks: {e}")
-        print(traceback.format_exc())
+        log.exception(f"Error in current_tasks: {e}")
         return render_template('partials/section3_current_tasks.html',
                               tasks=[],
                               progress=None,
@@ -93,9 +93,7 @@ def failed_tasks():
                               tasks=failed)
     except Exception as e:
         # Log the error and return empty state
-        import traceback
-        print(f"ERROR in failed_tasks: {e}")
-        print(traceback.format_exc())
+        log.exception(f"Error in failed_tasks: {e}")
         return render_template('partials/section3_failed_tasks.html',
                               tasks=[])
 
@@ -107,15 +105,17 @@ def completed_tasks():
 
     Query params:
         page: Page number (default 1)
-        per_page: Items per page (default 20)
+        per_page: Items per page (default 20, at most 100)
 
     Returns:
         HTML partial with completed tasks
     """
     try:
         user_id = session.get('user_id')
-        page = int(request.args.get('page', 1))
-        per_page = int(request.args.get('per_page', 20))
+        # Non-numeric values fall back to the defaults; clamp so a zero or
+        # negative value can't divide by zero or slice from the end
+        page = max(request.args.get('page', 1, type=int), 1)
+        per_page = min(max(request.args.get('per_page', 20, type=int), 1), 100)
 
         # Return empty if no user_id
         if not user_id:
@@ -149,9 +149,7 @@ def completed_tasks():
                               total_pages=total_pages)
     except Exception as e:
         # Log the error and return empty state
-        import traceback
-        print(f"ERROR in completed_tasks: {e}")
-        print(traceback.format_exc())
+        log.exception(f"Error in completed_tasks: {e}")
         return render_template('partials/section3_completed_tasks.html',
                               tasks=[],
                               page=1,